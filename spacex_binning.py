@@ -0,0 +1,34 @@
+"""
+SpaceX Falcon 9 First Stage Landing Prediction
+Vectorized binning for dense charts
+
+Once there are too many launches to draw one marker each, the payload
+charts plot per-class 2D histograms instead. This module only depends on
+NumPy, so the Plotly dashboard can use it without importing matplotlib.
+"""
+
+import numpy as np
+
+def density_bins(x, y, success, bins=80):
+    """Bin points into per-class 2D histograms in one vectorized pass
+    
+    Returns x/y bin edges and (x_bins, y_bins) count arrays for failed and
+    successful landings. Used by the EDA and dashboard payload charts once
+    there are too many launches to draw one marker each.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    success = np.asarray(success, dtype=float)
+    
+    x_edges = np.histogram_bin_edges(x, bins=bins)
+    y_edges = np.histogram_bin_edges(y, bins=bins)
+    counts, _ = np.histogramdd(
+        np.column_stack([x, y, success]),
+        bins=[x_edges, y_edges, np.array([-0.5, 0.5, 1.5])]
+    )
+    return {
+        'x_edges': x_edges,
+        'y_edges': y_edges,
+        'failed': counts[:, :, 0],
+        'success': counts[:, :, 1],
+    }
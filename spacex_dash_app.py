@@ -7,21 +7,76 @@ SpaceX launch data and landing success patterns.
 """
 
 import pandas as pd
+import numpy as np
+import sys
+import threading
+import time
+from collections import OrderedDict
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from plotly.offline import get_plotlyjs
 import dash
 from dash import dcc, html, Input, Output
 import dash_bootstrap_components as dbc
+from spacex_binning import density_bins
+
+class TTLCache:
+    """Least-recently-used cache whose entries also expire after ttl seconds"""
+    
+    def __init__(self, maxsize=128, ttl=300):
+        """Keep at most maxsize entries, each for at most ttl seconds"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() on a miss or expiry
+        
+        Dash serves callbacks from several threads, so lookups, inserts and
+        evictions hold the lock; compute() runs outside it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            entry = self.entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        value = compute()
+        
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
 
 class SpaceXDashboard:
     """Class for creating Plotly Dash dashboard"""
     
-    def __init__(self, data_path='data/spacex_launch_data.csv'):
-        """Initialize dashboard"""
+    # Above this many payload points the scatter switches to binned heatmaps
+    PAYLOAD_DENSITY_THRESHOLD = 100000
+    
+    # Payload bin width of the live app's aggregate cube and range slider step
+    PAYLOAD_BIN_KG = 500
+    
+    def __init__(self, data_path='data/spacex_launch_data.csv', cache_size=256, cache_ttl=600):
+        """Initialize dashboard
+        
+        cache_size and cache_ttl (seconds) bound the live app's memoized
+        figures per filter state.
+        """
         self.data_path = data_path
         self.df = None
         self.app = None
+        self.cube = None
+        self.figure_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
         
     def load_data(self):
         """Load launch data"""
@@ -189,7 +244,11 @@ class SpaceXDashboard:
     
     def create_payload_analysis(self):
         """Create scatter plot of payload mass vs success"""
-        df_payload = self.df[self.df['PayloadMass'] > 0].copy()
+        mask = self.df['PayloadMass'] > 0
+        if mask.sum() > self.PAYLOAD_DENSITY_THRESHOLD:
+            return self.create_payload_density(mask)
+        
+        df_payload = self.df[mask].copy()
         
         fig = px.scatter(
             df_payload,
@@ -207,6 +266,39 @@ class SpaceXDashboard:
         
         return fig
     
+    def create_payload_density(self, mask):
+        """Create binned payload mass vs flight number heatmaps per landing outcome"""
+        density = density_bins(self.df.loc[mask, 'PayloadMass'],
+                               self.df.loc[mask, 'FlightNumber'],
+                               self.df.loc[mask, 'Class'])
+        x_centers = (density['x_edges'][:-1] + density['x_edges'][1:]) / 2
+        y_centers = (density['y_edges'][:-1] + density['y_edges'][1:]) / 2
+        
+        fig = make_subplots(
+            rows=1, cols=2, shared_yaxes=True,
+            subplot_titles=('Failed Landings', 'Successful Landings')
+        )
+        
+        for col, (key, colorscale) in enumerate([('failed', 'Reds'), ('success', 'Greens')], 1):
+            counts = density[key].T
+            fig.add_trace(
+                go.Heatmap(
+                    x=x_centers,
+                    y=y_centers,
+                    z=np.where(counts > 0, counts, np.nan),
+                    colorscale=colorscale,
+                    showscale=False,
+                    hovertemplate='Payload: %{x:.0f} kg<br>Flight: %{y:.0f}<br>Launches: %{z}<extra></extra>'
+                ),
+                row=1, col=col
+            )
+            fig.update_xaxes(title_text="Payload Mass (kg)", row=1, col=col)
+        
+        fig.update_yaxes(title_text="Flight Number", row=1, col=1)
+        fig.update_layout(height=400, title_text='Payload Mass vs Landing Success (density)')
+        
+        return fig
+    
     def create_feature_comparison(self):
         """Create comparison of features (GridFins, Reused, Legs)"""
         features = ['GridFins', 'Reused', 'Legs']
@@ -240,28 +332,201 @@ class SpaceXDashboard:
         
         return fig
     
-    def create_static_dashboard(self):
-        """Create static HTML dashboard with all visualizations"""
+    def compute_cube(self):
+        """Aggregate landing outcomes by (LaunchSite, payload bin, Year, Orbit) in one pass
+        
+        The live app filters and rolls up this cube instead of the launch
+        rows, so callback cost depends on the number of distinct groups,
+        not on the number of launches. Launches without a payload mass go
+        to bin -1.
+        """
+        payload = self.df['PayloadMass']
+        payload_bin = np.where(payload > 0, payload // self.PAYLOAD_BIN_KG, -1).astype(int)
+        keys = [self.df['LaunchSite'].fillna('Unknown'), pd.Series(payload_bin, index=self.df.index, name='PayloadBin'),
+                self.df['Year'], self.df['Orbit'].fillna('Unknown')]
+        self.cube = self.df['Class'].groupby(keys).agg(['sum', 'count']).reset_index()
+        self.figure_cache = TTLCache(self.figure_cache.maxsize, self.figure_cache.ttl)
+        return self.cube
+    
+    def _filter_cube(self, sites, payload_range):
+        """Return the cube rows for the selected sites and payload range (kg)
+        
+        The range is [low, high): the slider snaps to bin edges, so the bin
+        starting at high is excluded.
+        """
+        cube = self.cube
+        mask = np.ones(len(cube), dtype=bool)
+        if sites:
+            mask &= cube['LaunchSite'].isin(sites).to_numpy()
+        
+        low, high = payload_range
+        first_bin, last_bin = self._payload_bin_limits()
+        low_bin = int(np.floor(low / self.PAYLOAD_BIN_KG))
+        high_bin = int(np.ceil(high / self.PAYLOAD_BIN_KG)) - 1
+        payload_bins = cube['PayloadBin'].to_numpy()
+        in_range = (payload_bins >= low_bin) & (payload_bins <= high_bin)
+        if low_bin <= first_bin and high_bin >= last_bin:
+            in_range |= payload_bins == -1  # Full range keeps unknown payloads
+        return cube[mask & in_range]
+    
+    def _payload_bin_limits(self):
+        """Return the lowest and highest payload bins present in the cube"""
+        bins = self.cube.loc[self.cube['PayloadBin'] >= 0, 'PayloadBin']
+        return (int(bins.min()), int(bins.max())) if len(bins) else (0, 0)
+    
+    @staticmethod
+    def _rollup(cube, key):
+        """Sum the cube by one key and add a success rate in percent"""
+        stats = cube.groupby(key)[['sum', 'count']].sum()
+        stats['success_rate'] = stats['sum'] / stats['count'] * 100
+        return stats.reset_index()
+    
+    def filtered_figures(self, sites, payload_range):
+        """Build the live app's summary text and figures for one filter state"""
+        cube = self._filter_cube(sites, payload_range)
+        successes, launches = int(cube['sum'].sum()), int(cube['count'].sum())
+        summary = (f"{launches} launches, {successes} successful landings "
+                   f"({successes / launches * 100:.1f}%)" if launches else "No launches match the filters")
+        
+        pie = go.Figure(data=[go.Pie(
+            labels=['Failed/No Attempt', 'Successful'],
+            values=[launches - successes, successes],
+            marker=dict(colors=['#FF6B6B', '#51CF66']),
+            textinfo='label+percent'
+        )])
+        pie.update_layout(title='Landing Outcomes', height=400)
+        
+        yearly = self._rollup(cube, 'Year')
+        trend = go.Figure(go.Scatter(x=yearly['Year'], y=yearly['success_rate'], mode='lines+markers',
+                                     line=dict(color='green', width=3), customdata=yearly['count'],
+                                     hovertemplate='%{x}: %{y:.1f}% of %{customdata} launches<extra></extra>'))
+        trend.update_layout(title='Success Rate by Year', xaxis_title='Year',
+                            yaxis_title='Success Rate (%)', height=400)
+        
+        site = self._rollup(cube, 'LaunchSite').sort_values('success_rate')
+        by_site = go.Figure(go.Bar(y=site['LaunchSite'], x=site['success_rate'], orientation='h',
+                                   marker_color='green', customdata=site['count'],
+                                   hovertemplate='%{y}: %{x:.1f}% of %{customdata} launches<extra></extra>'))
+        by_site.update_layout(title='Success Rate by Launch Site', xaxis_title='Success Rate (%)', height=400)
+        
+        payload = self._rollup(cube[cube['PayloadBin'] >= 0], 'PayloadBin')
+        by_payload = go.Figure(go.Bar(x=(payload['PayloadBin'] + 0.5) * self.PAYLOAD_BIN_KG,
+                                      y=payload['success_rate'], width=self.PAYLOAD_BIN_KG * 0.9,
+                                      marker_color='steelblue', customdata=payload['count'],
+                                      hovertemplate='%{x:.0f} kg: %{y:.1f}% of %{customdata} launches<extra></extra>'))
+        by_payload.update_layout(title='Success Rate by Payload Mass', xaxis_title='Payload Mass (kg)',
+                                 yaxis_title='Success Rate (%)', height=400)
+        
+        return summary, pie, trend, by_site, by_payload
+    
+    def create_app(self):
+        """Create the live Dash app with launch site and payload range filters
+        
+        Callbacks are served from the aggregate cube, and the figures for
+        each filter state are memoized in an LRU cache with a TTL.
+        """
+        if self.cube is None:
+            self.compute_cube()
+        
+        first_bin, last_bin = self._payload_bin_limits()
+        payload_min, payload_max = first_bin * self.PAYLOAD_BIN_KG, (last_bin + 1) * self.PAYLOAD_BIN_KG
+        sites = sorted(self.cube['LaunchSite'].unique())
+        
+        app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+        app.title = 'SpaceX Falcon 9 Landing Analysis'
+        
+        app.layout = dbc.Container([
+            html.H1('🚀 SpaceX Falcon 9 Landing Analysis Dashboard', className='text-center my-4'),
+            dbc.Row([
+                dbc.Col([
+                    html.Label('Launch Sites'),
+                    dcc.Dropdown(id='site-filter', options=[{'label': s, 'value': s} for s in sites],
+                                 multi=True, placeholder='All launch sites'),
+                ], md=6),
+                dbc.Col([
+                    html.Label('Payload Mass (kg)'),
+                    dcc.RangeSlider(id='payload-filter', min=payload_min, max=payload_max,
+                                    step=self.PAYLOAD_BIN_KG, value=[payload_min, payload_max],
+                                    marks=None, tooltip={'placement': 'bottom'}),
+                ], md=6),
+            ], className='mb-3'),
+            html.H5(id='filter-summary', className='text-center mb-3'),
+            dbc.Row([
+                dbc.Col(dcc.Graph(id='success-pie'), md=6),
+                dbc.Col(dcc.Graph(id='success-trend'), md=6),
+            ]),
+            dbc.Row([
+                dbc.Col(dcc.Graph(id='site-success'), md=6),
+                dbc.Col(dcc.Graph(id='payload-success'), md=6),
+            ]),
+        ], fluid=True)
+        
+        @app.callback(
+            [Output('filter-summary', 'children'), Output('success-pie', 'figure'),
+             Output('success-trend', 'figure'), Output('site-success', 'figure'),
+             Output('payload-success', 'figure')],
+            [Input('site-filter', 'value'), Input('payload-filter', 'value')]
+        )
+        def update_figures(selected_sites, payload_range):
+            key = (tuple(sorted(selected_sites or [])), tuple(payload_range))
+            return self.figure_cache.get_or_compute(
+                key, lambda: self.filtered_figures(list(key[0]), key[1]))
+        
+        self.app = app
+        return app
+    
+    def run_server(self, host='127.0.0.1', port=8050, debug=False):
+        """Serve the live Dash app"""
+        app = self.app or self.create_app()
+        print(f"\nServing dashboard at http://{host}:{port}/ (Ctrl+C to stop)")
+        app.run(host=host, port=port, debug=debug)
+    
+    # Static dashboard charts: (file name, figure method)
+    STATIC_CHARTS = [
+        ('success_pie', 'create_success_pie_chart'),
+        ('success_over_time', 'create_success_over_time'),
+        ('launch_site_analysis', 'create_launch_site_analysis'),
+        ('orbit_analysis', 'create_orbit_analysis'),
+        ('payload_analysis', 'create_payload_analysis'),
+        ('feature_comparison', 'create_feature_comparison'),
+    ]
+    
+    def create_static_dashboard(self, plotlyjs='directory'):
+        """Create static HTML dashboard with all visualizations
+        
+        plotly.js is written once: plotlyjs='directory' saves
+        dashboard/plotly.min.js and every page references it;
+        plotlyjs='inline' embeds it only in spacex_dashboard.html so that page
+        is self-contained, and the individual chart pages load plotly.js
+        from the CDN. All figures render as divs in the dashboard page.
+        """
+        if plotlyjs not in ('directory', 'inline'):
+            raise ValueError("plotlyjs must be 'directory' or 'inline'")
+        
         print("\nGenerating dashboard visualizations...")
         
         # Create all figures
-        fig1 = self.create_success_pie_chart()
-        fig2 = self.create_success_over_time()
-        fig3 = self.create_launch_site_analysis()
-        fig4 = self.create_orbit_analysis()
-        fig5 = self.create_payload_analysis()
-        fig6 = self.create_feature_comparison()
-        
-        # Save figures as HTML
+        figures = [(name, getattr(self, method)()) for name, method in self.STATIC_CHARTS]
+        
+        # Save figures as HTML sharing one plotly.js (the inline copy lives in the dashboard page)
         import os
         os.makedirs('dashboard', exist_ok=True)
         
-        fig1.write_html('dashboard/success_pie.html')
-        fig2.write_html('dashboard/success_over_time.html')
-        fig3.write_html('dashboard/launch_site_analysis.html')
-        fig4.write_html('dashboard/orbit_analysis.html')
-        fig5.write_html('dashboard/payload_analysis.html')
-        fig6.write_html('dashboard/feature_comparison.html')
+        chart_plotlyjs = 'cdn' if plotlyjs == 'inline' else 'directory'
+        for name, fig in figures:
+            fig.write_html(f'dashboard/{name}.html', include_plotlyjs=chart_plotlyjs)
+        
+        if plotlyjs == 'inline':
+            plotly_script = f"<script type=\"text/javascript\">{get_plotlyjs()}</script>"
+        else:
+            plotly_script = '<script src="plotly.min.js"></script>'
+        
+        charts = "\n".join(
+            f'        <div class="chart-container">\n'
+            f'{fig.to_html(full_html=False, include_plotlyjs=False, div_id=name)}\n'
+            f'        </div>'
+            for name, fig in figures
+        )
         
         # Create combined dashboard
         with open('dashboard/spacex_dashboard.html', 'w') as f:
@@ -269,7 +534,9 @@ class SpaceXDashboard:
 <!DOCTYPE html>
 <html>
 <head>
+    <meta charset="utf-8">
     <title>SpaceX Falcon 9 Landing Analysis Dashboard</title>
+    ''' + plotly_script + '''
     <style>
         body {
             font-family: Arial, sans-serif;
@@ -295,11 +562,7 @@ class SpaceXDashboard:
             padding: 15px;
             border-radius: 10px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        iframe {
-            width: 100%;
-            height: 500px;
-            border: none;
+            min-height: 500px;
         }
     </style>
 </head>
@@ -310,40 +573,37 @@ class SpaceXDashboard:
     </div>
     
     <div class="dashboard-container">
-        <div class="chart-container">
-            <iframe src="success_pie.html"></iframe>
-        </div>
-        <div class="chart-container">
-            <iframe src="success_over_time.html"></iframe>
-        </div>
-        <div class="chart-container">
-            <iframe src="launch_site_analysis.html"></iframe>
-        </div>
-        <div class="chart-container">
-            <iframe src="orbit_analysis.html"></iframe>
-        </div>
-        <div class="chart-container">
-            <iframe src="payload_analysis.html"></iframe>
-        </div>
-        <div class="chart-container">
-            <iframe src="feature_comparison.html"></iframe>
-        </div>
+''' + charts + '''
     </div>
 </body>
 </html>
             ''')
         
         print("✓ Dashboard created: dashboard/spacex_dashboard.html")
-        print("✓ Individual charts saved in dashboard/ directory")
+        if plotlyjs == 'directory':
+            print("✓ Individual charts saved in dashboard/ directory")
+            print("✓ Shared plotly.js saved: dashboard/plotly.min.js")
+        else:
+            print("✓ plotly.js inlined once in dashboard/spacex_dashboard.html")
+            print("✓ Individual charts saved in dashboard/ directory (plotly.js from CDN)")
 
-def main():
-    """Main function to create dashboard"""
+def main(live=False):
+    """Main function to create dashboard
+    
+    live=True (--live on the command line) serves the interactive Dash
+    app instead of writing the static HTML dashboard.
+    """
     print("\n" + "="*70)
     print("CREATING SPACEX PLOTLY DASH DASHBOARD")
     print("="*70)
     
     dashboard = SpaceXDashboard()
     dashboard.load_data()
+    
+    if live:
+        dashboard.run_server()
+        return
+    
     dashboard.create_static_dashboard()
     
     print("\n" + "="*70)
@@ -352,5 +612,5 @@ def main():
     print("\nOpen 'dashboard/spacex_dashboard.html' in a web browser to view the dashboard.")
 
 if __name__ == "__main__":
-    main()
+    main(live='--live' in sys.argv)
 
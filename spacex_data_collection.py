@@ -10,6 +10,7 @@ import requests
 import pandas as pd
 import json
 from datetime import datetime
+from spacex_launchpads import load_registry
 
 class SpaceXDataCollector:
     """Class to collect and process SpaceX launch data"""
@@ -178,6 +179,10 @@ def main():
     # Save data
     collector.save_data(df)
     
+    # Refresh the launchpad coordinate registry in one bulk request
+    registry = load_registry(fetch=True)
+    print(f"Launchpad registry: {len(registry)} launchpads")
+    
     return df
 
 if __name__ == "__main__":
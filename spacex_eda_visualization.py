@@ -10,35 +10,389 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import json
+import os
+import sys
 import warnings
+from spacex_binning import density_bins
+from spacex_rendering import (DEFAULT_PROFILE, FigureCache, init_render_worker,
+                              profile_from_argv, render_figure)
+from spacex_sketches import LaunchSketches, source_fingerprint
 warnings.filterwarnings('ignore')
 
 # Set style for better-looking plots
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
+# Chart drawing functions
+#
+# Each function receives the small aggregate computed by SpaceXEDA in the
+# parent process and returns a finished figure. They live at module level
+# so they can be sent to worker processes.
+
+def draw_success_rate_over_time(success_by_year):
+    """Draw landing success rate and launch count per year"""
+    fig = plt.figure(figsize=(12, 6))
+    plt.subplot(1, 2, 1)
+    plt.plot(success_by_year.index, success_by_year['success_rate'], marker='o', linewidth=2)
+    plt.xlabel('Year', fontsize=12)
+    plt.ylabel('Success Rate (%)', fontsize=12)
+    plt.title('First Stage Landing Success Rate Over Time', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(1, 2, 2)
+    plt.bar(success_by_year.index, success_by_year['count'], alpha=0.7, color='steelblue')
+    plt.xlabel('Year', fontsize=12)
+    plt.ylabel('Number of Launches', fontsize=12)
+    plt.title('Number of Falcon 9 Launches per Year', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3, axis='y')
+    
+    plt.tight_layout()
+    return fig
+
+def draw_success_by_launch_site(site_success):
+    """Draw landing success rate and launch count per launch site"""
+    fig = plt.figure(figsize=(12, 6))
+    plt.subplot(1, 2, 1)
+    plt.barh(range(len(site_success)), site_success['success_rate'], color='green', alpha=0.7)
+    plt.yticks(range(len(site_success)), site_success.index)
+    plt.xlabel('Success Rate (%)', fontsize=12)
+    plt.title('Landing Success Rate by Launch Site', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3, axis='x')
+    
+    plt.subplot(1, 2, 2)
+    plt.barh(range(len(site_success)), site_success['count'], color='steelblue', alpha=0.7)
+    plt.yticks(range(len(site_success)), site_success.index)
+    plt.xlabel('Number of Launches', fontsize=12)
+    plt.title('Number of Launches by Site', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3, axis='x')
+    
+    plt.tight_layout()
+    return fig
+
+def draw_success_by_orbit(orbit_success):
+    """Draw landing success rate per orbit type"""
+    fig = plt.figure(figsize=(14, 6))
+    x = range(len(orbit_success))
+    plt.bar(x, orbit_success['success_rate'], alpha=0.7, color='coral')
+    plt.xticks(x, orbit_success.index, rotation=45, ha='right')
+    plt.xlabel('Orbit Type', fontsize=12)
+    plt.ylabel('Success Rate (%)', fontsize=12)
+    plt.title('Landing Success Rate by Orbit Type (min 5 launches)', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3, axis='y')
+    plt.tight_layout()
+    return fig
+
+def draw_payload_vs_success(payload):
+    """Draw payload mass against launch index, colored by landing success"""
+    if payload.get('mode') == 'density':
+        return draw_payload_density(payload)
+    
+    fig = plt.figure(figsize=(12, 6))
+    
+    # Scatter plot
+    success_color = np.where(payload['success'] == 1, 'green', 'red')
+    plt.scatter(payload['payload_mass'], payload['launch_index'],
+               c=success_color, alpha=0.6, s=50)
+    plt.xlabel('Payload Mass (kg)', fontsize=12)
+    plt.ylabel('Launch Index', fontsize=12)
+    plt.title('Payload Mass vs Landing Success', fontsize=14, fontweight='bold')
+    plt.legend(['Failed', 'Success'])
+    plt.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    return fig
+
+def draw_payload_density(density):
+    """Draw binned payload mass vs flight number counts, one panel per outcome"""
+    fig, axes = plt.subplots(1, 2, figsize=(12, 6), sharex=True, sharey=True)
+    
+    panels = [('failed', 'Failed Landings', 'Reds'), ('success', 'Successful Landings', 'Greens')]
+    for ax, (key, title, cmap) in zip(axes, panels):
+        counts = np.ma.masked_equal(density[key].T, 0)
+        mesh = ax.pcolormesh(density['x_edges'], density['y_edges'], counts,
+                             cmap=cmap, rasterized=True)
+        fig.colorbar(mesh, ax=ax, label='Launches')
+        ax.set_xlabel('Payload Mass (kg)', fontsize=12)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+    axes[0].set_ylabel('Flight Number', fontsize=12)
+    
+    fig.suptitle('Payload Mass vs Landing Success (density)', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    return fig
+
+def draw_correlation_heatmap(correlation):
+    """Draw a correlation matrix as an annotated heatmap"""
+    fig = plt.figure(figsize=(10, 8))
+    sns.heatmap(correlation, annot=True, fmt='.2f', cmap='coolwarm', center=0,
+               square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+    plt.title('Feature Correlation Heatmap', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    return fig
+
+def draw_feature_importance(feature_rates):
+    """Draw landing success rate with and without each feature"""
+    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    
+    for idx, (feature, success_rate) in enumerate(feature_rates.items()):
+        axes[idx].bar(['No', 'Yes'], success_rate.values, color=['red', 'green'], alpha=0.7)
+        axes[idx].set_ylabel('Success Rate (%)', fontsize=11)
+        axes[idx].set_title(f'Success Rate by {feature}', fontsize=12, fontweight='bold')
+        axes[idx].grid(True, alpha=0.3, axis='y')
+        axes[idx].set_ylim([0, 100])
+    
+    plt.tight_layout()
+    return fig
+
+def _correlation_shard(args):
+    """Accumulate co-moments over one row range of a memory-mapped .npy file"""
+    path, start, stop, columns, chunksize = args
+    array = np.load(path, mmap_mode='r')
+    return OnlineCovariance.from_array(array[start:stop], columns, chunksize)
+
+class OnlineCovariance:
+    """Streaming covariance/correlation accumulator
+    
+    Consumes data in chunks and keeps, for every pair of columns, the
+    number of rows where both are present, both columns' means and sums of
+    squared deviations over those rows, and their co-moment. Missing values
+    are handled pairwise, as in DataFrame.corr(). Accumulators built over
+    separate shards can be merged (Chan et al. pairwise update), so the
+    result is the exact correlation matrix of all rows seen, computed in a
+    single pass.
+    """
+    
+    def __init__(self, columns):
+        """Start an empty accumulator for the given column names"""
+        self.columns = list(columns)
+        k = len(self.columns)
+        # [i, j] entries are taken over the rows where columns i and j are both present
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))      # mean of column i
+        self.m2 = np.zeros((k, k))        # squared deviations of column i
+        self.comoment = np.zeros((k, k))  # co-moment of columns i and j
+    
+    def update(self, chunk):
+        """Add a 2D array (rows x columns) of observations"""
+        chunk = np.asarray(chunk, dtype=float)
+        present = ~np.isnan(chunk)
+        if not present.any():
+            return self
+        
+        # Shift by the column means for numerical stability, zero the gaps
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            shift = np.nan_to_num(np.nanmean(chunk, axis=0))
+        values = np.where(present, chunk - shift, 0.0)
+        mask = present.astype(float)
+        
+        other = OnlineCovariance(self.columns)
+        other.n = mask.T @ mask
+        sums = values.T @ mask
+        with np.errstate(invalid='ignore', divide='ignore'):
+            centered_mean = np.where(other.n > 0, sums / other.n, 0.0)
+        other.mean = centered_mean + shift[:, None]
+        other.m2 = (values ** 2).T @ mask - centered_mean * sums
+        other.comoment = values.T @ values - centered_mean * sums.T
+        return self.merge(other)
+    
+    def merge(self, other):
+        """Fold another accumulator over the same columns into this one"""
+        n = self.n + other.n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, self.n * other.n / n, 0.0)
+            share = np.where(n > 0, other.n / n, 0.0)
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + delta * delta.T * weight
+        self.m2 = self.m2 + other.m2 + delta ** 2 * weight
+        self.mean = self.mean + delta * share
+        self.n = n
+        return self
+    
+    def covariance(self):
+        """Return the sample covariance matrix as a DataFrame"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = np.where(self.n > 1, self.comoment / (self.n - 1), np.nan)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+    
+    def correlation(self):
+        """Return the Pearson correlation matrix as a DataFrame"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr = np.where(self.n > 1, corr, np.nan)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+    
+    @classmethod
+    def from_frame(cls, df, columns, chunksize=100000):
+        """Accumulate over an in-memory DataFrame one row slice at a time"""
+        acc = cls(columns)
+        positions = [df.columns.get_loc(col) for col in columns]
+        for start in range(0, len(df), chunksize):
+            acc.update(df.iloc[start:start + chunksize, positions].to_numpy(dtype=float))
+        return acc
+    
+    @classmethod
+    def from_csv(cls, path, columns, chunksize=100000):
+        """Accumulate over a memory-mapped CSV file read in chunks"""
+        acc = cls(columns)
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize, memory_map=True):
+            acc.update(chunk[columns].to_numpy(dtype=float))
+        return acc
+    
+    @classmethod
+    def from_array(cls, array, columns, chunksize=100000):
+        """Accumulate over a 2D array, e.g. np.load(path, mmap_mode='r')"""
+        acc = cls(columns)
+        for start in range(0, len(array), chunksize):
+            acc.update(array[start:start + chunksize])
+        return acc
+    
+    @classmethod
+    def combine(cls, accumulators):
+        """Merge accumulators built over separate shards of the data"""
+        accumulators = list(accumulators)
+        combined = cls(accumulators[0].columns)
+        for acc in accumulators:
+            combined.merge(acc)
+        return combined
+
 class SpaceXEDA:
     """Class for Exploratory Data Analysis of SpaceX launch data"""
     
-    def __init__(self, data_path='data/spacex_launch_data.csv'):
-        """Initialize with data path"""
+    # Chart name -> (aggregate method, draw function, output file)
+    CHARTS = {
+        'success_rate_over_time': ('_success_rate_over_time_data', draw_success_rate_over_time,
+                                   'images/success_rate_over_time.png'),
+        'success_by_launch_site': ('_success_by_launch_site_data', draw_success_by_launch_site,
+                                   'images/success_by_launch_site.png'),
+        'success_by_orbit': ('_success_by_orbit_data', draw_success_by_orbit,
+                             'images/success_by_orbit.png'),
+        'payload_vs_success': ('_payload_vs_success_data', draw_payload_vs_success,
+                               'images/payload_vs_success.png'),
+        'correlation_heatmap': ('_correlation_data', draw_correlation_heatmap,
+                                'images/correlation_heatmap.png'),
+        'feature_importance': ('_feature_importance_data', draw_feature_importance,
+                               'images/feature_importance.png'),
+    }
+    
+    # Technical features compared in the feature impact plot and report
+    FEATURES = ['GridFins', 'Reused', 'Legs']
+    
+    # Above this many payload points the scatter switches to a binned density plot
+    PAYLOAD_DENSITY_THRESHOLD = 100000
+    
+    # Numerical features in the correlation heatmap
+    CORRELATION_FEATURES = ['FlightNumber', 'PayloadCount', 'PayloadMass', 'GridFins',
+                            'Reused', 'Legs', 'Class']
+    
+    # Rows per chunk fed to the streaming correlation accumulator
+    CORRELATION_CHUNKSIZE = 100000
+    
+    # Persisted sketches behind basic_statistics(approximate=True)
+    SKETCH_PATH = 'data/eda_sketches.json'
+    SKETCH_CHUNKSIZE = 1000000
+    
+    def __init__(self, data_path='data/spacex_launch_data.csv', render_workers=None,
+                 render_profile=DEFAULT_PROFILE):
+        """Initialize with data path
+        
+        render_workers sets the chart rendering process pool size
+        (None uses one worker per CPU, 1 renders in this process).
+        render_profile is 'preview' or 'publication' (see spacex_rendering).
+        """
         self.data_path = data_path
+        self.render_workers = render_workers
+        self.render_profile = render_profile
         self.df = None
-        
+        self.aggregates = None
+    
     def load_data(self):
         """Load data from CSV"""
         self.df = pd.read_csv(self.data_path)
         self.df['Date'] = pd.to_datetime(self.df['Date'])
+        self.aggregates = None
         print(f"Data loaded: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
         return self.df
     
-    def basic_statistics(self):
-        """Display basic statistical information"""
+    def compute_aggregates(self):
+        """Compute landing success statistics for every plot and the report in one scan
+        
+        A single groupby over (Year, LaunchSite, Orbit, feature flags) builds
+        a small cube of success sums and counts. The per-year, per-site,
+        per-orbit and per-feature tables are then rolled up from the cube
+        without touching the full frame again.
+        """
+        features = [f for f in self.FEATURES if f in self.df.columns]
+        keys = [self.df['Date'].dt.year.rename('Year'), self.df['LaunchSite'], self.df['Orbit']]
+        keys += [self.df[f] for f in features]
+        
+        cube = self.df['Class'].groupby(keys, dropna=False).agg(['sum', 'count'])
+        
+        def rollup(level):
+            stats = cube.groupby(level=level).sum()
+            stats['mean'] = stats['sum'] / stats['count']
+            stats['success_rate'] = stats['mean'] * 100
+            return stats
+        
+        total = int(cube['count'].sum())
+        successes = int(cube['sum'].sum())
+        
+        self.aggregates = {
+            'overall': {
+                'launches': total,
+                'successes': successes,
+                'failures': total - successes,
+                'success_rate': successes / total * 100 if total else 0.0,
+            },
+            'year': rollup('Year'),
+            'site': rollup('LaunchSite'),
+            'orbit': rollup('Orbit'),
+            'features': {feature: rollup(feature) for feature in features},
+        }
+        return self.aggregates
+    
+    def get_aggregates(self):
+        """Return the shared aggregates, computing them on first use"""
+        if self.aggregates is None:
+            self.compute_aggregates()
+        return self.aggregates
+    
+    def load_sketches(self, rebuild=False):
+        """Return summary sketches for the data file, building them if stale
+        
+        Sketches are built in one chunked pass over the CSV and saved to
+        SKETCH_PATH. They are reused until the data file's size or
+        modification time changes.
+        """
+        if not rebuild and os.path.exists(self.SKETCH_PATH):
+            sketches = LaunchSketches.load(self.SKETCH_PATH)
+            if sketches.source == source_fingerprint(self.data_path):
+                return sketches
+        
+        sketches = LaunchSketches.from_csv(self.data_path, chunksize=self.SKETCH_CHUNKSIZE)
+        os.makedirs(os.path.dirname(self.SKETCH_PATH), exist_ok=True)
+        sketches.save(self.SKETCH_PATH)
+        return sketches
+    
+    def basic_statistics(self, approximate=False):
+        """Display basic statistical information
+        
+        With approximate=True the figures come from persisted mergeable
+        sketches (see spacex_sketches) instead of full column scans. Counts,
+        min, max and mean stay exact; distinct counts and payload quartiles
+        carry a small bounded error.
+        """
         print("\n" + "="*60)
-        print("BASIC STATISTICS")
+        print("BASIC STATISTICS" + (" (APPROXIMATE)" if approximate else ""))
         print("="*60)
         
+        if approximate:
+            self._print_approximate_statistics(self.load_sketches().summary())
+            return
+        
         print(f"\nTotal Falcon 9 Launches: {len(self.df)}")
         print(f"Successful Landings: {self.df['Class'].sum()}")
         print(f"Failed Landings: {len(self.df) - self.df['Class'].sum()}")
@@ -56,151 +410,212 @@ class SpaceXEDA:
                 print(f"  Min: {payload_data.min():.2f} kg")
                 print(f"  Max: {payload_data.max():.2f} kg")
     
+    def _print_approximate_statistics(self, stats):
+        """Print the basic statistics computed from sketches"""
+        print(f"\nTotal Falcon 9 Launches: {stats['launches']}")
+        print(f"Successful Landings: {stats['successes']}")
+        print(f"Failed Landings: {stats['launches'] - stats['successes']}")
+        print(f"Success Rate: {stats['success_rate']:.2f}%")
+        
+        print(f"\nDate Range: {stats['date_min']} to {stats['date_max']}")
+        print(f"\nUnique Launch Sites: ~{stats['unique_sites']}")
+        print(f"Unique Orbits: ~{stats['unique_orbits']}")
+        print("Top Orbits: " + ", ".join(f"{orbit} (~{count})" for orbit, count in stats['top_orbits']))
+        
+        if stats['payload_mean'] is not None:
+            q25, q50, q75 = stats['payload_quartiles']
+            print(f"\nPayload Mass Statistics:")
+            print(f"  Average: {stats['payload_mean']:.2f} kg")
+            print(f"  Min: {stats['payload_min']:.2f} kg")
+            print(f"  Max: {stats['payload_max']:.2f} kg")
+            print(f"  Quartiles: ~{q25:.2f} / ~{q50:.2f} / ~{q75:.2f} kg")
+    
+    def _success_rate_over_time_data(self):
+        """Aggregate landing success by year"""
+        return self.get_aggregates()['year']
+    
+    def _success_by_launch_site_data(self):
+        """Aggregate landing success by launch site"""
+        site_success = self.get_aggregates()['site']
+        return site_success.sort_values('success_rate', ascending=False)
+    
+    def _success_by_orbit_data(self):
+        """Aggregate landing success by orbit type"""
+        orbit_success = self.get_aggregates()['orbit']
+        orbit_success = orbit_success[orbit_success['count'] >= 5]  # Filter orbits with at least 5 launches
+        return orbit_success.sort_values('success_rate', ascending=False)
+    
+    def _payload_vs_success_data(self):
+        """Collect payload mass points, or None when there are none"""
+        mask = (self.df['PayloadMass'] > 0).to_numpy()
+        if not mask.any():
+            return None
+        
+        if mask.sum() > self.PAYLOAD_DENSITY_THRESHOLD:
+            flight = self.df['FlightNumber'] if 'FlightNumber' in self.df.columns else self.df.index
+            density = density_bins(self.df['PayloadMass'].to_numpy()[mask],
+                                   np.asarray(flight)[mask],
+                                   self.df['Class'].to_numpy()[mask])
+            density['mode'] = 'density'
+            return density
+        
+        return {
+            'mode': 'points',
+            'payload_mass': self.df['PayloadMass'].to_numpy()[mask],
+            'launch_index': self.df.index.to_numpy()[mask],
+            'success': self.df['Class'].to_numpy()[mask],
+        }
+    
+    def _correlation_data(self):
+        """Compute the correlation matrix of numerical features"""
+        # Filter columns that exist in the dataframe
+        available_features = [col for col in self.CORRELATION_FEATURES if col in self.df.columns]
+        
+        # Accumulate chunk by chunk instead of copying the selected columns
+        acc = OnlineCovariance.from_frame(self.df, available_features, self.CORRELATION_CHUNKSIZE)
+        return acc.correlation()
+    
+    def correlation_from_source(self, path=None, workers=1):
+        """Compute the feature correlation matrix in one pass over a file
+        
+        path is a CSV (read memory-mapped in chunks) or a .npy array whose
+        columns are CORRELATION_FEATURES (opened with mmap_mode='r').
+        With workers > 1 a .npy source is split into shards that are
+        accumulated in parallel and merged.
+        """
+        path = path or self.data_path
+        
+        if path.endswith('.npy'):
+            array = np.load(path, mmap_mode='r')
+            columns = self.CORRELATION_FEATURES[:array.shape[1]]
+            if workers > 1:
+                bounds = np.linspace(0, len(array), workers + 1, dtype=int)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    shards = pool.map(_correlation_shard,
+                                      [(path, lo, hi, columns, self.CORRELATION_CHUNKSIZE)
+                                       for lo, hi in zip(bounds[:-1], bounds[1:])])
+                    return OnlineCovariance.combine(shards).correlation()
+            return OnlineCovariance.from_array(array, columns, self.CORRELATION_CHUNKSIZE).correlation()
+        
+        header = pd.read_csv(path, nrows=0).columns
+        columns = [col for col in self.CORRELATION_FEATURES if col in header]
+        return OnlineCovariance.from_csv(path, columns, self.CORRELATION_CHUNKSIZE).correlation()
+    
+    def _feature_importance_data(self):
+        """Aggregate landing success rate with and without each feature"""
+        return {
+            feature: stats['success_rate']
+            for feature, stats in self.get_aggregates()['features'].items()
+        }
+    
+    def chart_jobs(self, names=None):
+        """Build (name, draw function, aggregate, output path) render jobs"""
+        jobs = []
+        for name in names or self.CHARTS:
+            data_method, draw, output_path = self.CHARTS[name]
+            data = getattr(self, data_method)()
+            if data is not None:
+                jobs.append((name, draw, data, output_path))
+        return jobs
+    
+    def render_charts(self, names=None):
+        """Render charts, in a process pool when more than one worker is available
+        
+        Aggregates are computed here; workers only receive those small
+        results and do the drawing and PNG encoding. Charts whose
+        aggregates, drawing code and profile match a cached render are
+        copied from the figure cache instead of being redrawn.
+        """
+        profile = self.render_profile
+        cache = FigureCache()
+        jobs = []
+        for name, draw, data, path in self.chart_jobs(names):
+            key = cache.key(draw, data, profile, chart=name)
+            if cache.restore(key, path):
+                print(f"✓ Cached: {path}")
+            else:
+                jobs.append((name, draw, data, path, key))
+        
+        workers = self.render_workers or os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+        
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         initializer=init_render_worker) as pool:
+                    futures = [pool.submit(render_figure, draw, data, path, profile)
+                               for _, draw, data, path, _ in jobs]
+                    saved = [future.result() for future in futures]
+            except Exception as e:
+                # e.g. draw functions not importable under the spawn start method
+                print(f"⚠ Parallel rendering unavailable ({e}); rendering sequentially")
+                saved = [render_figure(draw, data, path, profile) for _, draw, data, path, _ in jobs]
+        else:
+            saved = [render_figure(draw, data, path, profile) for _, draw, data, path, _ in jobs]
+        
+        for name, draw, _, path, key in jobs:
+            cache.store(key, path, draw, profile, chart=name)
+            print(f"✓ Saved ({profile}): {path}")
+        return saved
+    
     def plot_success_rate_over_time(self):
         """Plot landing success rate over time"""
-        df_time = self.df.copy()
-        df_time['Year'] = df_time['Date'].dt.year
-        
-        # Calculate success rate by year
-        success_by_year = df_time.groupby('Year')['Class'].agg(['sum', 'count', 'mean'])
-        success_by_year['success_rate'] = success_by_year['mean'] * 100
-        
-        plt.figure(figsize=(12, 6))
-        plt.subplot(1, 2, 1)
-        plt.plot(success_by_year.index, success_by_year['success_rate'], marker='o', linewidth=2)
-        plt.xlabel('Year', fontsize=12)
-        plt.ylabel('Success Rate (%)', fontsize=12)
-        plt.title('First Stage Landing Success Rate Over Time', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        
-        plt.subplot(1, 2, 2)
-        plt.bar(success_by_year.index, success_by_year['count'], alpha=0.7, color='steelblue')
-        plt.xlabel('Year', fontsize=12)
-        plt.ylabel('Number of Launches', fontsize=12)
-        plt.title('Number of Falcon 9 Launches per Year', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3, axis='y')
-        
-        plt.tight_layout()
-        plt.savefig('images/success_rate_over_time.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved: images/success_rate_over_time.png")
-        plt.close()
+        return self.render_charts(['success_rate_over_time'])
     
     def plot_success_by_launch_site(self):
         """Plot success rate by launch site"""
-        site_success = self.df.groupby('LaunchSite')['Class'].agg(['sum', 'count', 'mean'])
-        site_success['success_rate'] = site_success['mean'] * 100
-        site_success = site_success.sort_values('success_rate', ascending=False)
-        
-        plt.figure(figsize=(12, 6))
-        plt.subplot(1, 2, 1)
-        plt.barh(range(len(site_success)), site_success['success_rate'], color='green', alpha=0.7)
-        plt.yticks(range(len(site_success)), site_success.index)
-        plt.xlabel('Success Rate (%)', fontsize=12)
-        plt.title('Landing Success Rate by Launch Site', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3, axis='x')
-        
-        plt.subplot(1, 2, 2)
-        plt.barh(range(len(site_success)), site_success['count'], color='steelblue', alpha=0.7)
-        plt.yticks(range(len(site_success)), site_success.index)
-        plt.xlabel('Number of Launches', fontsize=12)
-        plt.title('Number of Launches by Site', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3, axis='x')
-        
-        plt.tight_layout()
-        plt.savefig('images/success_by_launch_site.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved: images/success_by_launch_site.png")
-        plt.close()
+        return self.render_charts(['success_by_launch_site'])
     
     def plot_success_by_orbit(self):
         """Plot success rate by orbit type"""
-        orbit_success = self.df.groupby('Orbit')['Class'].agg(['sum', 'count', 'mean'])
-        orbit_success['success_rate'] = orbit_success['mean'] * 100
-        orbit_success = orbit_success[orbit_success['count'] >= 5]  # Filter orbits with at least 5 launches
-        orbit_success = orbit_success.sort_values('success_rate', ascending=False)
-        
-        plt.figure(figsize=(14, 6))
-        x = range(len(orbit_success))
-        plt.bar(x, orbit_success['success_rate'], alpha=0.7, color='coral')
-        plt.xticks(x, orbit_success.index, rotation=45, ha='right')
-        plt.xlabel('Orbit Type', fontsize=12)
-        plt.ylabel('Success Rate (%)', fontsize=12)
-        plt.title('Landing Success Rate by Orbit Type (min 5 launches)', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        plt.savefig('images/success_by_orbit.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved: images/success_by_orbit.png")
-        plt.close()
+        return self.render_charts(['success_by_orbit'])
     
     def plot_payload_vs_success(self):
         """Plot relationship between payload mass and landing success"""
-        df_payload = self.df[self.df['PayloadMass'] > 0].copy()
-        
-        if len(df_payload) > 0:
-            plt.figure(figsize=(12, 6))
-            
-            # Scatter plot
-            success_color = df_payload['Class'].map({0: 'red', 1: 'green'})
-            plt.scatter(df_payload['PayloadMass'], df_payload.index, 
-                       c=success_color, alpha=0.6, s=50)
-            plt.xlabel('Payload Mass (kg)', fontsize=12)
-            plt.ylabel('Launch Index', fontsize=12)
-            plt.title('Payload Mass vs Landing Success', fontsize=14, fontweight='bold')
-            plt.legend(['Failed', 'Success'])
-            plt.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            plt.savefig('images/payload_vs_success.png', dpi=300, bbox_inches='tight')
-            print("✓ Saved: images/payload_vs_success.png")
-            plt.close()
+        return self.render_charts(['payload_vs_success'])
     
     def plot_correlation_heatmap(self):
         """Plot correlation heatmap of numerical features"""
-        numerical_features = ['FlightNumber', 'PayloadCount', 'PayloadMass', 'GridFins', 
-                            'Reused', 'Legs', 'Class']
-        
-        # Filter columns that exist in the dataframe
-        available_features = [col for col in numerical_features if col in self.df.columns]
-        df_numerical = self.df[available_features].copy()
-        
-        # Convert boolean to int
-        for col in df_numerical.columns:
-            if df_numerical[col].dtype == 'bool':
-                df_numerical[col] = df_numerical[col].astype(int)
-        
-        # Calculate correlation
-        correlation = df_numerical.corr()
-        
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(correlation, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-                   square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-        plt.title('Feature Correlation Heatmap', fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        plt.savefig('images/correlation_heatmap.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved: images/correlation_heatmap.png")
-        plt.close()
+        return self.render_charts(['correlation_heatmap'])
     
     def plot_feature_importance(self):
         """Plot feature importance for landing success"""
-        features_to_analyze = ['GridFins', 'Reused', 'Legs']
-        
-        fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        for idx, feature in enumerate(features_to_analyze):
-            if feature in self.df.columns:
-                success_rate = self.df.groupby(feature)['Class'].mean() * 100
-                axes[idx].bar(['No', 'Yes'], success_rate.values, color=['red', 'green'], alpha=0.7)
-                axes[idx].set_ylabel('Success Rate (%)', fontsize=11)
-                axes[idx].set_title(f'Success Rate by {feature}', fontsize=12, fontweight='bold')
-                axes[idx].grid(True, alpha=0.3, axis='y')
-                axes[idx].set_ylim([0, 100])
-        
-        plt.tight_layout()
-        plt.savefig('images/feature_importance.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved: images/feature_importance.png")
-        plt.close()
-    
-    def generate_summary_report(self):
-        """Generate a comprehensive summary report"""
+        return self.render_charts(['feature_importance'])
+    
+    @staticmethod
+    def _format_group_section(stats):
+        """Format per-group launch counts and success rates as report lines"""
+        lines = ("   " + stats.index.astype(str) + ":\n"
+                 + "     - Launches: " + stats['count'].astype(int).astype(str) + "\n"
+                 + "     - Success Rate: " + stats['success_rate'].map('{:.2f}%'.format))
+        return lines.str.cat(sep="\n")
+    
+    @staticmethod
+    def _group_records(stats, name):
+        """Convert a rolled-up statistics table to JSON-ready records"""
+        table = stats[['count', 'sum', 'success_rate']].rename(
+            columns={'count': 'launches', 'sum': 'successes'})
+        return json.loads(table.rename_axis(name).reset_index().to_json(orient='records'))
+    
+    def generate_summary_report(self, output_path='reports/eda_summary.txt',
+                                json_path='reports/eda_summary.json'):
+        """Generate a comprehensive summary report
+        
+        Every section is formatted from the shared aggregates. The same
+        numbers are also written as structured JSON to json_path.
+        """
+        aggregates = self.get_aggregates()
+        overall = aggregates['overall']
+        site_stats = aggregates['site']
+        orbit_stats = aggregates['orbit'].sort_values('count', ascending=False)
+        feature_rates = {
+            feature: {
+                'with': stats['success_rate'].get(True, float('nan')),
+                'without': stats['success_rate'].get(False, float('nan')),
+            }
+            for feature, stats in aggregates['features'].items()
+        }
+        
         report = []
         report.append("="*70)
         report.append("SPACEX FALCON 9 - EXPLORATORY DATA ANALYSIS SUMMARY")
@@ -210,43 +625,31 @@ class SpaceXEDA:
         # Overall statistics
         report.append("1. OVERALL STATISTICS")
         report.append("-" * 70)
-        report.append(f"   Total Launches: {len(self.df)}")
-        report.append(f"   Successful Landings: {self.df['Class'].sum()}")
-        report.append(f"   Failed Landings: {len(self.df) - self.df['Class'].sum()}")
-        report.append(f"   Overall Success Rate: {self.df['Class'].mean()*100:.2f}%")
+        report.append(f"   Total Launches: {overall['launches']}")
+        report.append(f"   Successful Landings: {overall['successes']}")
+        report.append(f"   Failed Landings: {overall['failures']}")
+        report.append(f"   Overall Success Rate: {overall['success_rate']:.2f}%")
         report.append("")
         
         # Launch site analysis
         report.append("2. LAUNCH SITE ANALYSIS")
         report.append("-" * 70)
-        site_stats = self.df.groupby('LaunchSite')['Class'].agg(['count', 'sum', 'mean'])
-        for site, stats in site_stats.iterrows():
-            report.append(f"   {site}:")
-            report.append(f"     - Launches: {stats['count']}")
-            report.append(f"     - Success Rate: {stats['mean']*100:.2f}%")
+        report.append(self._format_group_section(site_stats))
         report.append("")
         
         # Orbit analysis
         report.append("3. ORBIT TYPE ANALYSIS (Top 5 by launch count)")
         report.append("-" * 70)
-        orbit_stats = self.df.groupby('Orbit')['Class'].agg(['count', 'sum', 'mean'])
-        orbit_stats = orbit_stats.sort_values('count', ascending=False).head(5)
-        for orbit, stats in orbit_stats.iterrows():
-            report.append(f"   {orbit}:")
-            report.append(f"     - Launches: {stats['count']}")
-            report.append(f"     - Success Rate: {stats['mean']*100:.2f}%")
+        report.append(self._format_group_section(orbit_stats.head(5)))
         report.append("")
         
         # Feature analysis
         report.append("4. FEATURE IMPACT ANALYSIS")
         report.append("-" * 70)
-        for feature in ['GridFins', 'Reused', 'Legs']:
-            if feature in self.df.columns:
-                success_with = self.df[self.df[feature] == True]['Class'].mean() * 100
-                success_without = self.df[self.df[feature] == False]['Class'].mean() * 100
-                report.append(f"   {feature}:")
-                report.append(f"     - With {feature}: {success_with:.2f}% success rate")
-                report.append(f"     - Without {feature}: {success_without:.2f}% success rate")
+        for feature, rates in feature_rates.items():
+            report.append(f"   {feature}:")
+            report.append(f"     - With {feature}: {rates['with']:.2f}% success rate")
+            report.append(f"     - Without {feature}: {rates['without']:.2f}% success rate")
         report.append("")
         
         report.append("="*70)
@@ -255,14 +658,33 @@ class SpaceXEDA:
         print("\n" + report_text)
         
         # Save report
-        with open('reports/eda_summary.txt', 'w') as f:
+        with open(output_path, 'w') as f:
             f.write(report_text)
-        print("\n✓ Report saved to reports/eda_summary.txt")
+        print(f"\n✓ Report saved to {output_path}")
+        
+        # Save structured results
+        summary = {
+            'generated_on': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'data_path': self.data_path,
+            'overall': overall,
+            'launch_sites': self._group_records(site_stats, 'LaunchSite'),
+            'orbits': self._group_records(orbit_stats, 'Orbit'),
+            'features': {
+                feature: {key: None if pd.isna(rate) else float(rate) for key, rate in rates.items()}
+                for feature, rates in feature_rates.items()
+            },
+        }
+        with open(json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Summary saved to {json_path}")
         
         return report_text
     
-    def run_complete_analysis(self):
-        """Run complete EDA analysis and generate all visualizations"""
+    def run_complete_analysis(self, approximate=False):
+        """Run complete EDA analysis and generate all visualizations
+        
+        approximate=True prints the basic statistics from sketches.
+        """
         print("\n" + "="*60)
         print("STARTING EXPLORATORY DATA ANALYSIS")
         print("="*60)
@@ -271,20 +693,14 @@ class SpaceXEDA:
         self.load_data()
         
         # Basic statistics
-        self.basic_statistics()
+        self.basic_statistics(approximate=approximate)
         
         # Create directories for outputs
-        import os
         os.makedirs('images', exist_ok=True)
         os.makedirs('reports', exist_ok=True)
         
         print("\nGenerating visualizations...")
-        self.plot_success_rate_over_time()
-        self.plot_success_by_launch_site()
-        self.plot_success_by_orbit()
-        self.plot_payload_vs_success()
-        self.plot_correlation_heatmap()
-        self.plot_feature_importance()
+        self.render_charts()
         
         print("\nGenerating summary report...")
         self.generate_summary_report()
@@ -293,11 +709,15 @@ class SpaceXEDA:
         print("EDA COMPLETE!")
         print("="*60)
 
-def main():
-    """Main function to run EDA"""
-    eda = SpaceXEDA()
-    eda.run_complete_analysis()
+def main(render_profile=DEFAULT_PROFILE, approximate=False):
+    """Main function to run EDA
+    
+    Charts use the fast preview profile; pass render_profile='publication'
+    (or --publication on the command line) for full-resolution output.
+    approximate=True (--approximate) prints sketch-based basic statistics.
+    """
+    eda = SpaceXEDA(render_profile=render_profile)
+    eda.run_complete_analysis(approximate=approximate)
 
 if __name__ == "__main__":
-    main()
-
+    main(render_profile=profile_from_argv(sys.argv), approximate='--approximate' in sys.argv)
@@ -6,33 +6,286 @@ This script creates interactive maps showing SpaceX launch sites
 and landing success patterns.
 """
 
+import copy
+import hashlib
+import json
+import numpy as np
 import pandas as pd
 import folium
-from folium.plugins import MarkerCluster, MousePosition, HeatMap
+from branca.element import MacroElement
+from folium.plugins import FastMarkerCluster, HeatMapWithTime, MarkerCluster, MousePosition
+from concurrent.futures import ProcessPoolExecutor
+from jinja2 import Template
 import os
+from spacex_geo import (RECOVERY_ZONES, RecoveryZoneIndex, coordinate_array,
+                        haversine_matrix, site_recovery_features)
+from spacex_launchpads import get_registry
+from spacex_rendering import code_fingerprint
+
+def build_map(mapper, method, args=()):
+    """Build one map in a worker process (module level so it can be pickled)"""
+    getattr(mapper, method)(*args)
+
+class ExternalGeoJson(MacroElement):
+    """GeoJSON layer fetched from a separate data file when the map loads
+    
+    Only the data file's URL and a small styling script end up in the map
+    HTML. Launch features become colored circle markers and site features
+    larger blue circles, both with popups built on demand. Browsers block
+    fetch() for file:// pages, so serve the maps folder over HTTP
+    (e.g. python -m http.server) to view these maps.
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        fetch({{ this.data_url|tojson }})
+            .then(function (response) { return response.json(); })
+            .then(function (data) {
+                var statuses = {{ this.statuses|tojson }};
+                L.geoJSON(data, {
+                    pointToLayer: function (feature, latlng) {
+                        var p = feature.properties;
+                        if (p.kind === 'site') {
+                            return L.circleMarker(latlng, {radius: 10, color: 'darkblue',
+                                                           fillColor: 'lightblue', fillOpacity: 0.6});
+                        }
+                        var color = statuses[p.status][0];
+                        return L.circleMarker(latlng, {radius: 4, color: color,
+                                                       fillColor: color, fillOpacity: 0.7});
+                    },
+                    onEachFeature: function (feature, layer) {
+                        var p = feature.properties;
+                        layer.bindPopup(function () {
+                            if (p.kind === 'site') {
+                                return '<b>' + p.name + '</b><br>' +
+                                       'Site ID: ' + p.id + '<br>' +
+                                       'Total Launches: ' + p.launches + '<br>' +
+                                       'Successful Landings: ' + p.successes + '<br>' +
+                                       'Success Rate: ' + p.rate.toFixed(2) + '%<br>' +
+                                       'Orbit Mix: ' + p.orbits;
+                            }
+                            return '<b>' + p.name + '</b><br>' +
+                                   'Date: ' + p.date + '<br>' +
+                                   'Launch Site: ' + p.site + '<br>' +
+                                   'Orbit: ' + p.orbit + '<br>' +
+                                   'Landing Status: ' + statuses[p.status][1] + '<br>' +
+                                   'Payload Mass: ' + p.payload + ' kg';
+                        }, {maxWidth: 300});
+                    }
+                }).addTo({{ this._parent.get_name() }});
+            });
+        {% endmacro %}
+    """)
+    
+    def __init__(self, data_url, statuses):
+        """Load features from data_url (relative to the map HTML file)"""
+        super().__init__()
+        self._name = 'ExternalGeoJson'
+        self.data_url = data_url
+        self.statuses = statuses
+
+class GridClusterLayer(MacroElement):
+    """Launch clusters precomputed per zoom level and fetched as the map zooms
+    
+    The browser loads only the cluster file for the current zoom level
+    (centroid, launch count, landing successes, cell id per cluster).
+    Individual launches are fetched per cluster cell once the map is zoomed
+    past the finest cluster level, or when a finest-level cluster is
+    clicked. Like ExternalGeoJson, this needs the maps served over HTTP.
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent.get_name() }};
+            var baseUrl = {{ this.base_url|tojson }};
+            var zooms = {{ this.zooms|tojson }};
+            var statuses = {{ this.statuses|tojson }};
+            var sites = {{ this.site_names|tojson }};
+            var minZoom = zooms[0], maxZoom = zooms[zooms.length - 1];
+            var layer = L.layerGroup().addTo(map);
+            var cache = {};
+            var token = 0;
+            
+            function load(url) {
+                if (!cache[url]) {
+                    cache[url] = fetch(url).then(function (response) { return response.json(); });
+                }
+                return cache[url];
+            }
+            
+            function showLaunches(cell, current) {
+                load(baseUrl + '/leaf_' + cell + '.json').then(function (rows) {
+                    if (current !== token) { return; }
+                    var spread = rows.length > 1 ? 0.0005 * Math.sqrt(rows.length) : 0;
+                    rows.forEach(function (row, i) {
+                        // Spread launches sharing one pad on a small ring
+                        var angle = 2 * Math.PI * i / rows.length;
+                        var status = statuses[row[2]];
+                        L.circleMarker([row[0] + spread * Math.sin(angle), row[1] + spread * Math.cos(angle)], {
+                            radius: 5, color: status[0], fillColor: status[0], fillOpacity: 0.8
+                        }).bindPopup(
+                            '<b>' + row[3] + '</b><br>' +
+                            'Date: ' + row[4] + '<br>' +
+                            'Launch Site: ' + sites[row[5]] + '<br>' +
+                            'Orbit: ' + row[6] + '<br>' +
+                            'Landing Status: ' + status[1] + '<br>' +
+                            'Payload Mass: ' + row[7] + ' kg',
+                            {maxWidth: 300}
+                        ).addTo(layer);
+                    });
+                });
+            }
+            
+            function render() {
+                var current = ++token;
+                var zoom = map.getZoom();
+                var level = Math.max(minZoom, Math.min(maxZoom, zoom));
+                load(baseUrl + '/zoom_' + level + '.json').then(function (clusters) {
+                    if (current !== token) { return; }
+                    layer.clearLayers();
+                    clusters.forEach(function (c) {
+                        if (zoom > maxZoom) {
+                            if (map.getBounds().contains([c[0], c[1]])) { showLaunches(c[4], current); }
+                            return;
+                        }
+                        var rate = c[3] / c[2];
+                        L.circleMarker([c[0], c[1]], {
+                            radius: 8 + 3 * Math.log2(c[2]),
+                            color: rate >= 0.5 ? 'green' : 'red',
+                            fillOpacity: 0.5
+                        }).bindTooltip(
+                            c[2] + ' launches, ' + Math.round(rate * 100) + '% landed'
+                        ).on('click', function () {
+                            if (level === maxZoom) {
+                                showLaunches(c[4], current);
+                            } else {
+                                map.setView([c[0], c[1]], Math.min(level + 2, maxZoom));
+                            }
+                        }).addTo(layer);
+                    });
+                });
+            }
+            
+            map.on('zoomend', render);
+            render();
+        })();
+        {% endmacro %}
+    """)
+    
+    def __init__(self, base_url, zooms, statuses, site_names):
+        """Load cluster files from base_url (relative to the map HTML file)"""
+        super().__init__()
+        self._name = 'GridClusterLayer'
+        self.base_url = base_url
+        self.zooms = list(zooms)
+        self.statuses = statuses
+        self.site_names = site_names
 
 class SpaceXFoliumMapping:
     """Class for creating interactive Folium maps of SpaceX launches"""
     
-    def __init__(self, data_path='data/spacex_launch_data.csv'):
-        """Initialize with data path"""
+    # Above this many launches the success markers map uses FastMarkerCluster
+    FAST_MARKER_THRESHOLD = 5000
+    
+    # Landing status codes used by the FastMarkerCluster rows
+    LANDING_STATUSES = [('red', 'Failed'), ('green', 'Successful'), ('gray', 'No landing attempt')]
+    
+    # Trailing window (in months) summed into each frame of the activity heatmaps
+    ACTIVITY_WINDOW_MONTHS = 12
+    
+    # Map name -> (builder method, arguments, input ('sites' or 'launches'), output files)
+    MAPS = {
+        'launch_sites': ('create_launch_sites_map', (), 'sites',
+                         ['maps/spacex_launch_sites.html']),
+        'success_markers': ('create_success_markers_map', (), 'launches',
+                            ['maps/spacex_success_markers.html']),
+        'distance_markers': ('create_distance_markers_map', (), 'sites',
+                             ['maps/spacex_distance_markers.html']),
+        'geojson_launches': ('create_geojson_map', (), 'launches',
+                             ['maps/spacex_geojson_launches.html', 'maps/spacex_launches.geojson']),
+        'launches_activity': ('create_activity_heatmap', ('launches',), 'launches',
+                              ['maps/spacex_launches_activity.html']),
+        'landings_activity': ('create_activity_heatmap', ('landings',), 'launches',
+                              ['maps/spacex_landings_activity.html']),
+        'clustered_launches': ('create_clustered_launches_map', (), 'launches',
+                               ['maps/spacex_clustered_launches.html', 'maps/clusters/zoom_2.json']),
+    }
+    
+    # Bump to rebuild every map after changes the builder fingerprints do not
+    # cover (e.g. a folium upgrade or edits outside the spacex_* modules)
+    MAP_TEMPLATE_VERSION = 1
+    MAP_CACHE_PATH = 'maps/.map_cache.json'
+    
+    # Zoom levels with precomputed launch clusters, and grid cells per 256px tile edge
+    CLUSTER_ZOOMS = range(2, 11)
+    CLUSTER_CELLS_PER_TILE = 4
+    
+    def __init__(self, data_path='data/spacex_launch_data.csv', map_workers=None):
+        """Initialize with data path
+        
+        map_workers sets the map generation process pool size
+        (None uses one worker per map up to the CPU count, 1 builds
+        every map in this process).
+        """
         self.data_path = data_path
+        self.map_workers = map_workers
         self.df = None
+        self.site_stats = None
         
-        # Launch site coordinates (approximate)
-        self.launch_sites = {
-            'CCAFS LC-40': {'lat': 28.5618571, 'lon': -80.577366, 'name': 'Cape Canaveral'},
-            'CCAFS SLC-40': {'lat': 28.5618571, 'lon': -80.577366, 'name': 'Cape Canaveral'},
-            'KSC LC-39A': {'lat': 28.6080585, 'lon': -80.6039558, 'name': 'Kennedy Space Center'},
-            'VAFB SLC-4E': {'lat': 34.632093, 'lon': -120.610829, 'name': 'Vandenberg AFB'},
-        }
+        # Launch site coordinates from the shared launchpad registry
+        self.registry = get_registry()
+        self.launch_sites = self.registry.site_table()
         
     def load_data(self):
-        """Load launch data"""
+        """Load launch data and precompute per-site statistics"""
         self.df = pd.read_csv(self.data_path)
         print(f"Loaded {len(self.df)} launch records")
+        
+        # Resolve the data's LaunchSite values (ObjectIds or names) to coordinates
+        site_keys = self.df['LaunchSite'].dropna().unique()
+        self.launch_sites = self.registry.site_table(site_keys)
+        unknown = [key for key in site_keys if key not in self.launch_sites]
+        if unknown:
+            print(f"⚠ No coordinates for {len(unknown)} launch site(s): {', '.join(map(str, unknown))}")
+        
+        self.compute_site_stats()
         return self.df
     
+    def compute_site_stats(self):
+        """Compute per-site launch statistics for every map in one grouped pass
+        
+        One groupby over (LaunchSite, Orbit) gives launch counts and landing
+        successes; the per-site totals and orbit mix are rolled up from that
+        small table, so the maps never scan the launch rows again.
+        """
+        landing = (self.df['LandingSuccess'].fillna(0).astype(int) if 'LandingSuccess' in self.df.columns
+                   else pd.Series(0, index=self.df.index))
+        orbit = self.df['Orbit'].fillna('Unknown') if 'Orbit' in self.df.columns else 'Unknown'
+        by_orbit = landing.groupby([self.df['LaunchSite'], orbit]).agg(['size', 'sum'])
+        
+        stats = by_orbit.groupby(level=0).sum().rename(columns={'size': 'launches', 'sum': 'landing_successes'})
+        stats['success_rate'] = stats['landing_successes'] / stats['launches'] * 100
+        
+        orbit_counts = by_orbit['size'].sort_values(ascending=False)
+        stats['orbit_mix'] = (orbit_counts.index.get_level_values(1) + ' ' + orbit_counts.astype(str)).groupby(
+            orbit_counts.index.get_level_values(0)).agg(', '.join)
+        
+        self.site_stats = stats
+        return self.site_stats
+    
+    def site_summary(self, site_id):
+        """Return precomputed statistics for a site (zeros if it has no launches)"""
+        if self.site_stats is None or site_id not in self.site_stats.index:
+            return {'launches': 0, 'landing_successes': 0, 'success_rate': 0.0, 'orbit_mix': ''}
+        stats = self.site_stats.loc[site_id]
+        return {
+            'launches': int(stats['launches']),
+            'landing_successes': int(stats['landing_successes']),
+            'success_rate': float(stats['success_rate']),
+            'orbit_mix': stats['orbit_mix'],
+        }
+    
     def create_launch_sites_map(self):
         """Create interactive map of SpaceX launch sites"""
         # Center map on USA
@@ -44,14 +297,15 @@ class SpaceXFoliumMapping:
         
         # Add launch sites
         for site_id, site_info in self.launch_sites.items():
-            # Count launches from this site
-            site_launches = len(self.df[self.df['LaunchSite'] == site_id]) if self.df is not None else 0
+            # Launches from this site
+            stats = self.site_summary(site_id)
             
             # Create popup text
             popup_text = f"""
             <b>{site_info['name']}</b><br>
             Site ID: {site_id}<br>
-            Total Launches: {site_launches}
+            Total Launches: {stats['launches']}<br>
+            Orbit Mix: {stats['orbit_mix']}
             """
             
             # Add marker
@@ -80,15 +334,73 @@ class SpaceXFoliumMapping:
         
         return m
     
-    def create_success_markers_map(self):
-        """Create map with markers colored by landing success"""
-        # Center map on USA
-        m = folium.Map(
-            location=[37.0902, -95.7129],
-            zoom_start=4,
-            tiles='OpenStreetMap'
-        )
+    def _launch_table(self):
+        """Build a compact lat, lon, status, name, date, site, orbit, payload table of launches
+        
+        Coordinates come from a join against the launch site table and the
+        landing status is encoded as an index into LANDING_STATUSES, so the
+        table is built column-wise without a Python object per launch.
+        Launch sites are encoded as an index into the returned site names.
+        """
+        coords = pd.DataFrame.from_dict(self.launch_sites, orient='index')
+        launches = self.df.join(coords[['lat', 'lon']], on='LaunchSite', how='inner')
+        
+        landing = launches['LandingSuccess']
+        status = np.select([landing.isna(), landing == 1], [2, 1], default=0)
+        
+        site_codes, site_ids = pd.factorize(launches['LaunchSite'])
+        site_names = coords.loc[site_ids, 'name'].tolist()
+        
+        def text(column):
+            if column not in launches.columns:
+                return np.full(len(launches), 'Unknown', dtype=object)
+            return launches[column].fillna('Unknown').astype(str).to_numpy()
         
+        payload = (launches['PayloadMass'].round(2).astype(str).replace('nan', 'N/A')
+                   if 'PayloadMass' in launches.columns else pd.Series('N/A', index=launches.index))
+        
+        rows = pd.DataFrame({
+            'lat': launches['lat'].to_numpy(),
+            'lon': launches['lon'].to_numpy(),
+            'status': status,
+            'name': text('Name'),
+            'date': text('Date'),
+            'site': site_codes,
+            'orbit': text('Orbit'),
+            'payload': payload.to_numpy(),
+        })
+        return rows, site_names
+    
+    def _success_marker_rows(self):
+        """Return the launch table as one compact row list per launch, plus site names"""
+        rows, site_names = self._launch_table()
+        return rows.values.tolist(), site_names
+    
+    def _fast_marker_callback(self, site_names):
+        """JavaScript that turns one compact row into a colored marker with a popup"""
+        return """
+        function (row) {
+            var statuses = %s;
+            var sites = %s;
+            var status = statuses[row[2]];
+            var marker = L.marker(new L.LatLng(row[0], row[1]), {
+                icon: L.AwesomeMarkers.icon({icon: 'info-sign', markerColor: status[0]})
+            });
+            marker.bindPopup(
+                '<b>' + row[3] + '</b><br>' +
+                'Date: ' + row[4] + '<br>' +
+                'Launch Site: ' + sites[row[5]] + '<br>' +
+                'Orbit: ' + row[6] + '<br>' +
+                'Landing Status: ' + status[1] + '<br>' +
+                'Payload Mass: ' + row[7] + ' kg',
+                {maxWidth: 300}
+            );
+            return marker;
+        }
+        """ % (json.dumps(self.LANDING_STATUSES), json.dumps(site_names))
+    
+    def _add_launch_markers(self, m):
+        """Add one clustered folium Marker with its own popup per launch"""
         # Add markers for each launch
         marker_cluster = MarkerCluster().add_to(m)
         
@@ -124,6 +436,29 @@ class SpaceXFoliumMapping:
                     popup=folium.Popup(popup_text, max_width=300),
                     icon=folium.Icon(color=color, icon='info-sign')
                 ).add_to(marker_cluster)
+    
+    def create_success_markers_map(self, fast=None):
+        """Create map with markers colored by landing success
+        
+        fast=True sends all launches to the browser as one data array
+        rendered by FastMarkerCluster, instead of one folium Marker per
+        launch. By default it is used above FAST_MARKER_THRESHOLD launches.
+        """
+        if fast is None:
+            fast = len(self.df) > self.FAST_MARKER_THRESHOLD
+        
+        # Center map on USA
+        m = folium.Map(
+            location=[37.0902, -95.7129],
+            zoom_start=4,
+            tiles='OpenStreetMap'
+        )
+        
+        if fast:
+            rows, site_names = self._success_marker_rows()
+            FastMarkerCluster(rows, callback=self._fast_marker_callback(site_names)).add_to(m)
+        else:
+            self._add_launch_markers(m)
         
         # Add legend
         legend_html = '''
@@ -146,6 +481,33 @@ class SpaceXFoliumMapping:
         
         return m
     
+    def _add_recovery_zones(self, m):
+        """Mark recovery zones and link each site to its nearest landing pad and droneship"""
+        index = RecoveryZoneIndex()
+        for zone_id, zone in RECOVERY_ZONES.items():
+            folium.CircleMarker(
+                location=[zone['lat'], zone['lon']],
+                radius=6,
+                color='green' if zone['type'] == 'pad' else 'purple',
+                fill=True,
+                fillOpacity=0.7,
+                tooltip=f"{zone['name']} ({zone_id}, {zone['type']})"
+            ).add_to(m)
+        
+        site_ids, coords = coordinate_array(self.launch_sites)
+        for zone_type, color in [('pad', 'green'), ('droneship', 'purple')]:
+            distances, nearest = index.nearest(coords, zone_type=zone_type)
+            for site_id, site_coords, zone_id, distance in zip(site_ids, coords, nearest[:, 0], distances[:, 0]):
+                zone = RECOVERY_ZONES[zone_id]
+                folium.PolyLine(
+                    locations=[site_coords.tolist(), [zone['lat'], zone['lon']]],
+                    color=color,
+                    weight=2,
+                    opacity=0.6,
+                    dash_array='5, 5',
+                    tooltip=f"{site_id} to {zone_id}: {distance:,.1f} km"
+                ).add_to(m)
+    
     def create_distance_markers_map(self):
         """Create map showing distance between launch sites"""
         # Center map on USA
@@ -155,13 +517,17 @@ class SpaceXFoliumMapping:
             tiles='CartoDB positron'
         )
         
+        # Recovery zone distances for every site in one bulk query
+        recovery = site_recovery_features(self.launch_sites)
+        
         # Add launch sites with detailed information
         for site_id, site_info in self.launch_sites.items():
             # Get site statistics
-            site_df = self.df[self.df['LaunchSite'] == site_id]
-            total_launches = len(site_df)
-            successful_landings = site_df['LandingSuccess'].sum() if 'LandingSuccess' in site_df.columns else 0
-            success_rate = (successful_landings / total_launches * 100) if total_launches > 0 else 0
+            stats = self.site_summary(site_id)
+            nearest = recovery.loc[site_id]
+            total_launches = stats['launches']
+            successful_landings = stats['landing_successes']
+            success_rate = stats['success_rate']
             
             # Create detailed popup
             popup_html = f"""
@@ -171,7 +537,10 @@ class SpaceXFoliumMapping:
                 <b>Coordinates:</b> {site_info['lat']:.4f}, {site_info['lon']:.4f}<br>
                 <b>Total Launches:</b> {total_launches}<br>
                 <b>Successful Landings:</b> {int(successful_landings)}<br>
-                <b>Success Rate:</b> {success_rate:.2f}%
+                <b>Success Rate:</b> {success_rate:.2f}%<br>
+                <b>Orbit Mix:</b> {stats['orbit_mix']}<br>
+                <b>Nearest Landing Pad:</b> {nearest['NearestLandingPadKm']:,.1f} km<br>
+                <b>Nearest Droneship Station:</b> {nearest['NearestDroneshipKm']:,.0f} km
             </div>
             """
             
@@ -193,19 +562,21 @@ class SpaceXFoliumMapping:
                 popup=f"{site_info['name']}<br>{total_launches} launches"
             ).add_to(m)
         
-        # Draw lines between launch sites
-        sites_list = list(self.launch_sites.values())
-        for i in range(len(sites_list)):
-            for j in range(i+1, len(sites_list)):
-                folium.PolyLine(
-                    locations=[
-                        [sites_list[i]['lat'], sites_list[i]['lon']],
-                        [sites_list[j]['lat'], sites_list[j]['lon']]
-                    ],
-                    color='red',
-                    weight=1,
-                    opacity=0.3
-                ).add_to(m)
+        # Draw lines between launch sites, labelled with great-circle distances
+        site_ids, coords = coordinate_array(self.launch_sites)
+        distances = haversine_matrix(coords, coords)
+        for i, j in zip(*np.triu_indices(len(site_ids), k=1)):
+            if distances[i, j] < 1:
+                continue  # Pads sharing one set of coordinates
+            folium.PolyLine(
+                locations=[coords[i].tolist(), coords[j].tolist()],
+                color='red',
+                weight=1,
+                opacity=0.3,
+                tooltip=f"{site_ids[i]} - {site_ids[j]}: {distances[i, j]:,.0f} km"
+            ).add_to(m)
+        
+        self._add_recovery_zones(m)
         
         # Save map
         output_path = 'maps/spacex_distance_markers.html'
@@ -214,6 +585,279 @@ class SpaceXFoliumMapping:
         
         return m
     
+    def export_geojson(self, output_path):
+        """Write launch sites and launches as one compact GeoJSON FeatureCollection"""
+        features = []
+        for site_id, site_info in self.launch_sites.items():
+            stats = self.site_summary(site_id)
+            features.append({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [site_info['lon'], site_info['lat']]},
+                'properties': {
+                    'kind': 'site',
+                    'id': site_id,
+                    'name': site_info['name'],
+                    'launches': stats['launches'],
+                    'successes': stats['landing_successes'],
+                    'rate': round(stats['success_rate'], 2),
+                    'orbits': stats['orbit_mix'],
+                },
+            })
+        
+        rows, site_names = self._success_marker_rows()
+        features.extend(
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [round(lon, 6), round(lat, 6)]},
+                'properties': {'kind': 'launch', 'name': name, 'date': date, 'site': site_names[site],
+                               'orbit': orbit, 'payload': payload, 'status': status},
+            }
+            for lat, lon, status, name, date, site, orbit, payload in rows
+        )
+        
+        with open(output_path, 'w') as f:
+            json.dump({'type': 'FeatureCollection', 'features': features}, f, separators=(',', ':'))
+        return output_path
+    
+    def create_geojson_map(self):
+        """Create a map whose launches and sites are loaded from an external GeoJSON file
+        
+        The HTML stays a small shell regardless of launch count; the
+        features live in maps/spacex_launches.geojson, which browsers and
+        web servers can cache and compress independently.
+        """
+        data_path = self.export_geojson('maps/spacex_launches.geojson')
+        
+        # Center map on USA
+        m = folium.Map(
+            location=[37.0902, -95.7129],
+            zoom_start=4,
+            tiles='OpenStreetMap'
+        )
+        
+        ExternalGeoJson(os.path.basename(data_path), self.LANDING_STATUSES).add_to(m)
+        
+        # Save map
+        output_path = 'maps/spacex_geojson_launches.html'
+        m.save(output_path)
+        print(f"✓ Saved GeoJSON launches map: {output_path} (data: {data_path})")
+        
+        return m
+    
+    def build_launch_clusters(self, output_dir='maps/clusters'):
+        """Precompute grid clusters of launches for every zoom level in CLUSTER_ZOOMS
+        
+        Launches are projected to Web Mercator once; at each zoom level they
+        are snapped to a grid of CLUSTER_CELLS_PER_TILE cells per map tile
+        and grouped into centroid, count and landing successes per cell.
+        zoom_<z>.json holds the clusters of one level and leaf_<cell>.json
+        the launches of one finest-level cell. Returns the site names used
+        by the leaf rows.
+        """
+        table, site_names = self._launch_table()
+        os.makedirs(output_dir, exist_ok=True)
+        for name in os.listdir(output_dir):
+            if name.startswith('leaf_'):
+                os.remove(os.path.join(output_dir, name))  # Cells of a previous dataset
+        
+        lat = np.radians(table['lat'].to_numpy(dtype=float))
+        x = (table['lon'].to_numpy(dtype=float) + 180) / 360
+        y = (1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / np.pi) / 2
+        success = (table['status'] == 1).astype(int)
+        
+        for zoom in self.CLUSTER_ZOOMS:
+            cells_per_axis = 2 ** zoom * self.CLUSTER_CELLS_PER_TILE
+            cx = np.clip((x * cells_per_axis).astype(np.int64), 0, cells_per_axis - 1)
+            cy = np.clip((y * cells_per_axis).astype(np.int64), 0, cells_per_axis - 1)
+            cell = pd.Series(cx * cells_per_axis + cy, index=table.index, name='cell')
+            
+            clusters = pd.DataFrame({'lat': table['lat'], 'lon': table['lon'], 'success': success}).groupby(cell).agg(
+                lat=('lat', 'mean'), lon=('lon', 'mean'), count=('lat', 'size'), successes=('success', 'sum'))
+            records = np.column_stack([clusters['lat'].round(5), clusters['lon'].round(5), clusters['count'],
+                                       clusters['successes'], clusters.index]).tolist()
+            with open(os.path.join(output_dir, f'zoom_{zoom}.json'), 'w') as f:
+                json.dump([[lat, lon, int(n), int(k), int(c)] for lat, lon, n, k, c in records], f,
+                          separators=(',', ':'))
+        
+        # Launch details per finest-level cell, fetched on demand
+        for cell_id, rows in table.groupby(cell):
+            with open(os.path.join(output_dir, f'leaf_{cell_id}.json'), 'w') as f:
+                json.dump(rows.values.tolist(), f, separators=(',', ':'))
+        
+        return site_names
+    
+    def create_clustered_launches_map(self):
+        """Create a map of server-side launch clusters that refine as the user zooms in
+        
+        The HTML shell and the first cluster file do not grow with the
+        number of launches; launch details are only fetched for zoomed-in
+        cells.
+        """
+        output_dir = 'maps/clusters'
+        site_names = self.build_launch_clusters(output_dir)
+        
+        # Center map on USA
+        m = folium.Map(
+            location=[37.0902, -95.7129],
+            zoom_start=4,
+            tiles='OpenStreetMap'
+        )
+        
+        GridClusterLayer(os.path.basename(output_dir), self.CLUSTER_ZOOMS,
+                         self.LANDING_STATUSES, site_names).add_to(m)
+        
+        # Save map
+        output_path = 'maps/spacex_clustered_launches.html'
+        m.save(output_path)
+        print(f"✓ Saved clustered launches map: {output_path} (clusters: {output_dir}/)")
+        
+        return m
+    
+    def activity_bins(self, metric='launches'):
+        """Bin launches (or successful landings) into a site x month weight table
+        
+        One groupby counts events per (site, month); the table is then
+        reindexed to every month in the launch history and summed over a
+        trailing ACTIVITY_WINDOW_MONTHS window. Rows are months, columns
+        are launch sites with known coordinates.
+        """
+        dates = pd.to_datetime(self.df['Date'], errors='coerce')
+        if metric == 'landings':
+            weights = self.df['LandingSuccess'].fillna(0).astype(int)
+        else:
+            weights = pd.Series(1, index=self.df.index)
+        
+        known = self.df['LaunchSite'].isin(self.launch_sites) & dates.notna()
+        months = dates[known].dt.to_period('M')
+        counts = weights[known].groupby([months, self.df.loc[known, 'LaunchSite']]).sum().unstack(fill_value=0)
+        
+        if counts.empty:
+            return counts
+        all_months = pd.period_range(counts.index.min(), counts.index.max(), freq='M')
+        counts = counts.reindex(all_months, fill_value=0)
+        return counts.rolling(self.ACTIVITY_WINDOW_MONTHS, min_periods=1).sum()
+    
+    def create_activity_heatmap(self, metric='launches'):
+        """Create a time-animated heatmap of launch or landing activity per site
+        
+        Each animation frame holds one weighted point per launch site, so the
+        payload grows with sites x months rather than with launches.
+        """
+        bins = self.activity_bins(metric)
+        coords = np.array([[self.launch_sites[site]['lat'], self.launch_sites[site]['lon']]
+                           for site in bins.columns]).reshape(-1, 2)
+        weights = bins.to_numpy(dtype=float)
+        if weights.size and weights.max() > 0:
+            weights = weights / weights.max()
+        
+        frames = [
+            [[lat, lon, weight] for (lat, lon), weight in zip(coords, frame) if weight > 0]
+            for frame in weights
+        ]
+        
+        # Center map on USA
+        m = folium.Map(
+            location=[37.0902, -95.7129],
+            zoom_start=4,
+            tiles='OpenStreetMap'
+        )
+        
+        HeatMapWithTime(
+            frames,
+            index=[str(month) for month in bins.index],
+            radius=40,
+            min_opacity=0.3,
+            max_opacity=0.8,
+            auto_play=True,
+            name=f"{metric.title()} (trailing {self.ACTIVITY_WINDOW_MONTHS} months)"
+        ).add_to(m)
+        
+        # Save map
+        output_path = f'maps/spacex_{metric}_activity.html'
+        m.save(output_path)
+        print(f"✓ Saved {metric} activity heatmap: {output_path}")
+        
+        return m
+    
+    def _input_hash(self, inputs):
+        """Hash the data a map is built from: site stats only, or every launch row"""
+        digest = hashlib.sha256(json.dumps(self.launch_sites, sort_keys=True).encode())
+        if inputs == 'sites':
+            digest.update(pd.util.hash_pandas_object(self.site_stats).values.tobytes())
+        else:
+            digest.update(pd.util.hash_pandas_object(self.df).values.tobytes())
+        return digest.hexdigest()
+    
+    def _map_key(self, method, args, input_hash):
+        """Cache key of one map: template version, builder code, arguments and input hash
+        
+        The builder's fingerprint follows its helper methods, class
+        constants (CLUSTER_ZOOMS, ...), module constants (RECOVERY_ZONES)
+        and the MacroElement classes with their JS templates.
+        """
+        digest = hashlib.sha256()
+        digest.update(str(self.MAP_TEMPLATE_VERSION).encode())
+        digest.update(code_fingerprint(getattr(type(self), method), owner=type(self)).encode())
+        digest.update(repr(args).encode())
+        digest.update(input_hash.encode())
+        return digest.hexdigest()
+    
+    def _worker_copy(self, inputs):
+        """Shallow copy to send to a worker; site-level maps get no launch rows"""
+        mapper = copy.copy(self)
+        if inputs == 'sites':
+            mapper.df = None
+        return mapper
+    
+    def build_maps(self, names=None):
+        """Build maps in a process pool, skipping maps whose inputs are unchanged
+        
+        Every map is keyed by MAP_TEMPLATE_VERSION, its builder's code (with
+        the helpers, templates and constants it uses) and arguments, and a
+        hash of its input data (the per-site stats for site-level maps, the
+        launch rows otherwise). Maps whose key matches the last build and
+        whose output files still exist are skipped.
+        """
+        names = list(names or self.MAPS)
+        cache = {}
+        if os.path.exists(self.MAP_CACHE_PATH):
+            with open(self.MAP_CACHE_PATH) as f:
+                cache = json.load(f)
+        
+        input_hashes = {inputs: self._input_hash(inputs) for inputs in {self.MAPS[n][2] for n in names}}
+        jobs = []
+        for name in names:
+            method, args, inputs, outputs = self.MAPS[name]
+            key = self._map_key(method, args, input_hashes[inputs])
+            if cache.get(name) == key and all(os.path.exists(path) for path in outputs):
+                print(f"✓ Unchanged: {outputs[0]}")
+            else:
+                jobs.append((name, method, args, inputs, key))
+        
+        workers = self.map_workers or os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+        
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(build_map, self._worker_copy(inputs), method, args)
+                               for _, method, args, inputs, _ in jobs]
+                    for future in futures:
+                        future.result()
+            except Exception as e:
+                print(f"⚠ Parallel map generation unavailable ({e}); building sequentially")
+                for _, method, args, _, _ in jobs:
+                    build_map(self, method, args)
+        else:
+            for _, method, args, _, _ in jobs:
+                build_map(self, method, args)
+        
+        for name, _, _, _, key in jobs:
+            cache[name] = key
+        with open(self.MAP_CACHE_PATH, 'w') as f:
+            json.dump(cache, f, indent=2)
+        return [name for name, *_ in jobs]
+    
     def generate_all_maps(self):
         """Generate all Folium maps"""
         print("\n" + "="*70)
@@ -228,9 +872,7 @@ class SpaceXFoliumMapping:
         
         # Generate maps
         print("\nCreating maps...")
-        self.create_launch_sites_map()
-        self.create_success_markers_map()
-        self.create_distance_markers_map()
+        self.build_maps()
         
         print("\n" + "="*70)
         print("MAP GENERATION COMPLETE!")
@@ -239,6 +881,10 @@ class SpaceXFoliumMapping:
         print("  1. maps/spacex_launch_sites.html - Basic launch sites map")
         print("  2. maps/spacex_success_markers.html - Success/failure markers")
         print("  3. maps/spacex_distance_markers.html - Sites with statistics")
+        print("  4. maps/spacex_geojson_launches.html - Launches loaded from spacex_launches.geojson")
+        print("  5. maps/spacex_launches_activity.html - Launch activity over time")
+        print("  6. maps/spacex_landings_activity.html - Successful landings over time")
+        print("  7. maps/spacex_clustered_launches.html - Zoom-dependent launch clusters")
         print("\nOpen these HTML files in a web browser to view interactive maps.")
 
 def main():
@@ -0,0 +1,126 @@
+"""
+SpaceX Falcon 9 First Stage Landing Prediction
+Geodesic distances between launch sites and recovery zones
+
+Launch site coordinates come from the launchpad registry
+(spacex_launchpads). Distances use the haversine formula on a spherical Earth. Bulk
+nearest-zone and within-radius queries go through a scikit-learn BallTree
+with the haversine metric, so they stay fast with thousands of recovery
+positions. The results feed the distance map and the ML feature matrix.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+from spacex_launchpads import get_registry
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+# Landing pads and typical droneship stations (droneships move per mission)
+RECOVERY_ZONES = {
+    'LZ-1': {'lat': 28.485833, 'lon': -80.544444, 'name': 'Landing Zone 1', 'type': 'pad'},
+    'LZ-2': {'lat': 28.485833, 'lon': -80.542778, 'name': 'Landing Zone 2', 'type': 'pad'},
+    'LZ-4': {'lat': 34.632989, 'lon': -120.615167, 'name': 'Landing Zone 4', 'type': 'pad'},
+    'OCISLY': {'lat': 32.0, 'lon': -76.5, 'name': 'Of Course I Still Love You', 'type': 'droneship'},
+    'ASOG': {'lat': 30.5, 'lon': -74.5, 'name': 'A Shortfall of Gravitas', 'type': 'droneship'},
+    'JRTI': {'lat': 33.0, 'lon': -122.5, 'name': 'Just Read the Instructions', 'type': 'droneship'},
+}
+
+def coordinate_array(locations):
+    """Return the ids and an (n, 2) array of [lat, lon] degrees for a location dict"""
+    ids = list(locations)
+    coords = np.array([[locations[i]['lat'], locations[i]['lon']] for i in ids], dtype=float)
+    return ids, coords.reshape(-1, 2)
+
+def haversine_matrix(a, b):
+    """Great-circle distances in km between every point of a and every point of b
+    
+    a and b are (n, 2) and (m, 2) arrays of [lat, lon] degrees; the result
+    is an (n, m) matrix computed with NumPy broadcasting.
+    """
+    a = np.radians(np.asarray(a, dtype=float).reshape(-1, 2))
+    b = np.radians(np.asarray(b, dtype=float).reshape(-1, 2))
+    dlat = b[None, :, 0] - a[:, None, 0]
+    dlon = b[None, :, 1] - a[:, None, 1]
+    h = (np.sin(dlat / 2) ** 2
+         + np.cos(a[:, None, 0]) * np.cos(b[None, :, 0]) * np.sin(dlon / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+
+class RecoveryZoneIndex:
+    """BallTree spatial indexes over recovery zones for bulk distance queries
+    
+    One tree covers every zone and one more is built per zone type, all
+    once at construction, so typed queries reuse an existing index.
+    """
+    
+    def __init__(self, zones=RECOVERY_ZONES):
+        """Index the zones dict ({id: {'lat', 'lon', 'name', 'type'}})"""
+        self.zones = zones
+        self.ids, self.coords = coordinate_array(zones)
+        self.ids = np.array(self.ids, dtype=object)
+        self.types = np.array([zones[i].get('type', 'pad') for i in self.ids], dtype=object)
+        self.tree = BallTree(np.radians(self.coords), metric='haversine')
+        self.typed_trees = {
+            zone_type: (BallTree(np.radians(self.coords[self.types == zone_type]), metric='haversine'),
+                        self.ids[self.types == zone_type])
+            for zone_type in pd.unique(self.types)
+        }
+    
+    def _tree(self, zone_type=None):
+        """Return the (tree, zone ids) pair for all zones or one zone type"""
+        if zone_type is None:
+            return self.tree, self.ids
+        if zone_type not in self.typed_trees:
+            raise ValueError(f"Unknown zone type '{zone_type}'. "
+                             f"Choose from: {', '.join(self.typed_trees)}")
+        return self.typed_trees[zone_type]
+    
+    def nearest(self, points, k=1, zone_type=None):
+        """Return (distances_km, zone_ids) arrays of shape (n, k) for each point
+        
+        zone_type restricts the search to 'pad' or 'droneship' zones.
+        """
+        points = np.radians(np.asarray(points, dtype=float).reshape(-1, 2))
+        tree, ids = self._tree(zone_type)
+        distances, positions = tree.query(points, k=min(k, len(ids)))
+        return distances * EARTH_RADIUS_KM, ids[positions]
+    
+    def within_radius(self, points, radius_km, zone_type=None):
+        """Return, per point, the ids and distances (km) of zones within radius_km
+        
+        zone_type restricts the search to 'pad' or 'droneship' zones.
+        """
+        points = np.radians(np.asarray(points, dtype=float).reshape(-1, 2))
+        tree, ids = self._tree(zone_type)
+        positions, distances = tree.query_radius(points, r=radius_km / EARTH_RADIUS_KM,
+                                                 return_distance=True, sort_results=True)
+        return [(ids[p], d * EARTH_RADIUS_KM) for p, d in zip(positions, distances)]
+    
+    def distance_matrix(self, points):
+        """Distances in km from each point to every indexed zone"""
+        return haversine_matrix(points, self.coords)
+
+def site_recovery_features(sites=None, index=None, radius_km=500):
+    """Per-site recovery geometry features, indexed by launch site id
+    
+    sites is a {site: {'lat', 'lon'}} dict and defaults to every pad in the
+    launchpad registry. Columns: nearest zone id and distance, nearest landing pad and
+    droneship distances, and the number of zones within radius_km.
+    """
+    sites = get_registry().site_table() if sites is None else sites
+    index = index or RecoveryZoneIndex()
+    site_ids, coords = coordinate_array(sites)
+    
+    distances, nearest = index.nearest(coords)
+    pad_km, _ = index.nearest(coords, zone_type='pad')
+    droneship_km, _ = index.nearest(coords, zone_type='droneship')
+    in_radius = index.within_radius(coords, radius_km)
+    
+    return pd.DataFrame({
+        'NearestRecoveryZone': nearest[:, 0],
+        'NearestRecoveryZoneKm': distances[:, 0],
+        'NearestLandingPadKm': pad_km[:, 0],
+        'NearestDroneshipKm': droneship_km[:, 0],
+        f'RecoveryZonesWithin{radius_km}Km': [len(ids) for ids, _ in in_radius],
+    }, index=pd.Index(site_ids, name='LaunchSite'))
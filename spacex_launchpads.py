@@ -0,0 +1,146 @@
+"""
+SpaceX Falcon 9 First Stage Landing Prediction
+Launchpad coordinate registry
+
+The registry maps launchpad ids and names to coordinates. It is filled in
+bulk from the SpaceX API launchpads endpoint (one request) or from the
+bundled fixture file, then saved as data/launchpads.json. Launch data
+stores LaunchSite as an API ObjectId, a short pad name or a legacy name
+such as 'CCAFS LC-40'; all of them resolve through one lookup index.
+get_registry() loads the registry once per process and shares it between
+the map, SQL and ML scripts.
+"""
+
+import json
+import os
+import re
+import pandas as pd
+import requests
+
+LAUNCHPADS_URL = "https://api.spacexdata.com/v4/launchpads"
+REGISTRY_PATH = 'data/launchpads.json'
+FIXTURE_PATH = 'data/launchpads_fixture.json'
+
+REGISTRY_COLUMNS = ['id', 'name', 'full_name', 'locality', 'region', 'latitude', 'longitude', 'aliases']
+
+def normalize_key(key):
+    """Normalize a launchpad id or name for lookup ('CCAFS LC-40' -> 'CCAFSLC40')"""
+    return re.sub(r'[^0-9A-Z]', '', str(key).upper())
+
+class LaunchpadRegistry:
+    """Launchpad records with an id/name lookup index"""
+    
+    def __init__(self, records):
+        """Build the registry from launchpad records (API or fixture format)"""
+        pads = pd.DataFrame(records)
+        for column in REGISTRY_COLUMNS:
+            if column not in pads.columns:
+                pads[column] = None
+        pads['aliases'] = pads['aliases'].apply(lambda a: list(a) if isinstance(a, (list, tuple)) else [])
+        self.pads = pads[REGISTRY_COLUMNS].set_index('id', drop=False)
+        
+        # Every id, name, full name and alias -> launchpad id
+        self.index = {}
+        for pad_id, name, full_name, aliases in self.pads[['id', 'name', 'full_name', 'aliases']].itertuples(index=False):
+            for key in [pad_id, name, full_name, *aliases]:
+                if key:
+                    self.index.setdefault(normalize_key(key), pad_id)
+    
+    def __len__(self):
+        """Number of launchpads"""
+        return len(self.pads)
+    
+    def resolve(self, keys):
+        """Return the launchpad id for each key (None where unknown)"""
+        keys = pd.Series(keys)
+        unique = keys.dropna().unique()
+        ids = {key: self.index.get(normalize_key(key)) for key in unique}
+        return keys.map(ids)
+    
+    def lookup(self, key):
+        """Return the launchpad record for an id or name, or None"""
+        pad_id = self.index.get(normalize_key(key))
+        return None if pad_id is None else self.pads.loc[pad_id].to_dict()
+    
+    def site_table(self, keys=None):
+        """Return {key: {'lat', 'lon', 'name'}} for the given keys (default: every pad)
+        
+        Keys that do not resolve to a launchpad are left out.
+        """
+        if keys is None:
+            keys = self.pads['name'].tolist()
+        table = {}
+        for key in pd.unique(pd.Series(keys).dropna()):
+            pad_id = self.index.get(normalize_key(key))
+            if pad_id is not None:
+                pad = self.pads.loc[pad_id]
+                table[key] = {'lat': float(pad['latitude']), 'lon': float(pad['longitude']),
+                              'name': pad['full_name'] or pad['name'], 'id': pad_id}
+        return table
+    
+    def lookup_table(self):
+        """Return a (key, launchpad_id) frame of every raw id, name and alias"""
+        rows = [(key, pad_id)
+                for pad_id, name, full_name, aliases in self.pads[['id', 'name', 'full_name', 'aliases']].itertuples(index=False)
+                for key in dict.fromkeys([pad_id, name, full_name, *aliases]) if key]
+        return pd.DataFrame(rows, columns=['key', 'launchpad_id'])
+    
+    def save(self, path=REGISTRY_PATH):
+        """Persist the registry as JSON"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.pads.to_dict(orient='records'), f, indent=2)
+        return path
+    
+    @classmethod
+    def from_file(cls, path):
+        """Load a registry from a JSON list of launchpad records"""
+        with open(path) as f:
+            return cls(json.load(f))
+    
+    @classmethod
+    def from_api(cls, url=LAUNCHPADS_URL, aliases=None, timeout=30):
+        """Fetch every launchpad in one request to the SpaceX API
+        
+        aliases ({id: [names]}) adds legacy names the API does not return.
+        """
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        records = response.json()
+        for record in records:
+            record['aliases'] = (aliases or {}).get(record.get('id'), [])
+        return cls(records)
+
+def load_registry(path=REGISTRY_PATH, fixture_path=FIXTURE_PATH, fetch=False):
+    """Load the saved registry, or build and save it from the API or the fixture
+    
+    With fetch=True the API is queried even if a saved registry exists;
+    if the request fails the saved registry or the fixture is used.
+    """
+    if fetch:
+        try:
+            aliases = {}
+            if os.path.exists(fixture_path):
+                fixture = LaunchpadRegistry.from_file(fixture_path)
+                aliases = fixture.pads['aliases'].to_dict()
+            registry = LaunchpadRegistry.from_api(aliases=aliases)
+            registry.save(path)
+            return registry
+        except Exception as e:
+            print(f"⚠ Could not fetch launchpads ({e}); using local registry")
+    
+    if os.path.exists(path):
+        return LaunchpadRegistry.from_file(path)
+    
+    registry = LaunchpadRegistry.from_file(fixture_path)
+    registry.save(path)
+    return registry
+
+_registry = None
+
+def get_registry():
+    """Return the process-wide launchpad registry, loading it on first use"""
+    global _registry
+    if _registry is None:
+        _registry = load_registry()
+    return _registry
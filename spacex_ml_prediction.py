@@ -18,15 +18,63 @@ from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
 import matplotlib.pyplot as plt
 import seaborn as sns
+import sys
 import warnings
+from spacex_geo import site_recovery_features
+from spacex_launchpads import get_registry
+from spacex_rendering import (DEFAULT_PROFILE, FigureCache, profile_from_argv,
+                              render_figure)
 warnings.filterwarnings('ignore')
 
+def draw_confusion_matrix(data):
+    """Draw a labelled confusion matrix for one model"""
+    fig = plt.figure(figsize=(8, 6))
+    sns.heatmap(data['matrix'], annot=True, fmt='d', cmap='Blues', 
+               xticklabels=['Failed', 'Success'],
+               yticklabels=['Failed', 'Success'])
+    plt.title(f'Confusion Matrix - {data["model_name"]}', fontsize=14, fontweight='bold')
+    plt.ylabel('True Label', fontsize=12)
+    plt.xlabel('Predicted Label', fontsize=12)
+    plt.tight_layout()
+    return fig
+
+def draw_model_comparison(results_df):
+    """Draw accuracy, precision, recall and F1 bars for all models"""
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    
+    metrics = ['Accuracy', 'Precision', 'Recall', 'F1-Score']
+    colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
+    
+    for idx, (metric, color) in enumerate(zip(metrics, colors)):
+        row = idx // 2
+        col = idx % 2
+        ax = axes[row, col]
+        
+        values = results_df[metric]
+        bars = ax.barh(results_df.index, values, color=color, alpha=0.7)
+        
+        # Add value labels
+        for i, (bar, value) in enumerate(zip(bars, values)):
+            ax.text(value + 0.01, i, f'{value:.3f}', va='center')
+        
+        ax.set_xlabel(metric, fontsize=12)
+        ax.set_title(f'{metric} Comparison', fontsize=14, fontweight='bold')
+        ax.set_xlim([0, 1.1])
+        ax.grid(True, alpha=0.3, axis='x')
+    
+    plt.tight_layout()
+    return fig
+
 class SpaceXMLPredictor:
     """Class for machine learning prediction of landing success"""
     
-    def __init__(self, data_path='data/spacex_launch_data.csv'):
+    # Launch site recovery distances added from spacex_geo
+    GEO_FEATURES = ['NearestLandingPadKm', 'NearestDroneshipKm']
+    
+    def __init__(self, data_path='data/spacex_launch_data.csv', render_profile=DEFAULT_PROFILE):
         """Initialize predictor"""
         self.data_path = data_path
+        self.render_profile = render_profile
         self.df = None
         self.X = None
         self.y = None
@@ -47,6 +95,14 @@ class SpaceXMLPredictor:
         feature_columns = ['FlightNumber', 'PayloadMass', 'GridFins', 'Reused', 
                           'Legs', 'PayloadCount']
         
+        # Recovery geometry of each launch site (distance to nearest pad/droneship)
+        sites = (get_registry().site_table(self.df['LaunchSite'].dropna().unique())
+                 if 'LaunchSite' in self.df.columns else {})
+        if sites:
+            recovery = site_recovery_features(sites)[self.GEO_FEATURES]
+            self.df = self.df.join(recovery, on='LaunchSite')
+            feature_columns += self.GEO_FEATURES
+        
         # Filter available columns
         available_features = [col for col in feature_columns if col in self.df.columns]
         
@@ -199,55 +255,36 @@ class SpaceXMLPredictor:
         
         return metrics, y_pred
     
+    def _render_figure(self, draw, data, output_path):
+        """Render a figure, or copy it from the figure cache when unchanged
+        
+        Returns True when the figure was redrawn.
+        """
+        cache = FigureCache()
+        key = cache.key(draw, data, self.render_profile)
+        if cache.restore(key, output_path):
+            print(f"✓ Cached: {output_path}")
+            return False
+        
+        render_figure(draw, data, output_path, self.render_profile)
+        cache.store(key, output_path, draw, self.render_profile)
+        return True
+    
     def plot_confusion_matrix(self, model_name, y_pred):
         """Plot confusion matrix"""
         cm = confusion_matrix(self.y_test, y_pred)
         
-        plt.figure(figsize=(8, 6))
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', 
-                   xticklabels=['Failed', 'Success'],
-                   yticklabels=['Failed', 'Success'])
-        plt.title(f'Confusion Matrix - {model_name}', fontsize=14, fontweight='bold')
-        plt.ylabel('True Label', fontsize=12)
-        plt.xlabel('Predicted Label', fontsize=12)
-        plt.tight_layout()
-        
         filename = f'images/confusion_matrix_{model_name.replace(" ", "_").lower()}.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        print(f"✓ Saved confusion matrix: {filename}")
-        plt.close()
+        if self._render_figure(draw_confusion_matrix, {'model_name': model_name, 'matrix': cm}, filename):
+            print(f"✓ Saved confusion matrix: {filename}")
     
     def plot_model_comparison(self):
         """Plot comparison of all models"""
         results_df = pd.DataFrame(self.results).T
         results_df = results_df.sort_values('Accuracy', ascending=False)
         
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-        
-        metrics = ['Accuracy', 'Precision', 'Recall', 'F1-Score']
-        colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
-        
-        for idx, (metric, color) in enumerate(zip(metrics, colors)):
-            row = idx // 2
-            col = idx % 2
-            ax = axes[row, col]
-            
-            values = results_df[metric]
-            bars = ax.barh(results_df.index, values, color=color, alpha=0.7)
-            
-            # Add value labels
-            for i, (bar, value) in enumerate(zip(bars, values)):
-                ax.text(value + 0.01, i, f'{value:.3f}', va='center')
-            
-            ax.set_xlabel(metric, fontsize=12)
-            ax.set_title(f'{metric} Comparison', fontsize=14, fontweight='bold')
-            ax.set_xlim([0, 1.1])
-            ax.grid(True, alpha=0.3, axis='x')
-        
-        plt.tight_layout()
-        plt.savefig('images/model_comparison.png', dpi=300, bbox_inches='tight')
-        print("✓ Saved model comparison: images/model_comparison.png")
-        plt.close()
+        if self._render_figure(draw_model_comparison, results_df, 'images/model_comparison.png'):
+            print("✓ Saved model comparison: images/model_comparison.png")
     
     def generate_prediction_report(self):
         """Generate comprehensive prediction report"""
@@ -348,11 +385,11 @@ class SpaceXMLPredictor:
         print("MACHINE LEARNING PREDICTION COMPLETE!")
         print("="*70)
 
-def main():
+def main(render_profile=DEFAULT_PROFILE):
     """Main function to run ML prediction"""
-    predictor = SpaceXMLPredictor()
+    predictor = SpaceXMLPredictor(render_profile=render_profile)
     predictor.run_complete_prediction()
 
 if __name__ == "__main__":
-    main()
+    main(render_profile=profile_from_argv(sys.argv))
 
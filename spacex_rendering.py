@@ -0,0 +1,233 @@
+"""
+SpaceX Falcon 9 First Stage Landing Prediction
+Shared figure rendering helpers
+
+Render profiles control how the matplotlib figures produced by the EDA
+and machine learning scripts are saved:
+
+  preview      - low DPI, optimized PNG, no tight-bbox pass (default)
+  publication  - full 300 DPI output with a tight bounding box
+
+Rendered figures are stored in a content-addressed cache keyed by the
+plotted data, the drawing function's code (including the functions it
+delegates to), the global matplotlib style and the render settings, so a
+figure is only redrawn when one of those changed.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+import matplotlib.pyplot as plt
+
+RENDER_PROFILES = {
+    'preview': {
+        'dpi': 72,
+        'bbox_inches': None,
+        'pil_kwargs': {'optimize': True},
+    },
+    'publication': {
+        'dpi': 300,
+        'bbox_inches': 'tight',
+    },
+}
+
+DEFAULT_PROFILE = 'preview'
+
+# Bump to invalidate every cached figure (e.g. after a style change)
+CACHE_VERSION = 1
+
+# Constant types whose repr is stable across processes
+FINGERPRINT_CONSTANTS = (bool, int, float, complex, str, bytes, tuple, list, dict, range, type(None))
+
+def _is_project_object(obj):
+    """Check whether a function or class is defined in one of this project's scripts"""
+    module = getattr(obj, '__module__', None) or ''
+    return module == '__main__' or module.startswith('spacex_')
+
+def code_fingerprint(func, owner=None):
+    """Hash a function's code together with everything it depends on
+    
+    Names the code refers to are followed transitively: project functions
+    (from the spacex_* modules) are hashed by their bytecode, constants and
+    names, project classes by their source (which covers class-level
+    templates), and plain data constants by their repr. With owner (a
+    class) set, attribute names such as self._helper or self.CONSTANT are
+    also resolved on that class, so a method's helpers and class
+    constants are part of its fingerprint. Unlike marshal.dumps, the
+    result is stable across processes, so it can key caches that outlive
+    a run.
+    """
+    parts = []
+    seen = set()
+    
+    def walk(code):
+        consts = tuple(walk(c) if hasattr(c, 'co_code') else repr(c) for c in code.co_consts)
+        return (code.co_code, consts, code.co_names)
+    
+    def names(code):
+        yield from code.co_names
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                yield from names(const)
+    
+    def resolve(name, scope):
+        if owner is not None:
+            for klass in owner.__mro__:
+                if name in vars(klass):
+                    visit(f"{owner.__name__}.{name}", vars(klass)[name])
+                    break
+        if name in scope:
+            visit(name, scope[name])
+    
+    def visit(label, obj):
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+        if id(obj) in seen:
+            return
+        
+        if hasattr(obj, '__code__') and _is_project_object(obj):
+            seen.add(id(obj))
+            parts.append((label, walk(obj.__code__)))
+            for name in sorted(set(names(obj.__code__))):
+                resolve(name, obj.__globals__)
+        elif isinstance(obj, type) and _is_project_object(obj):
+            seen.add(id(obj))
+            try:
+                parts.append((label, inspect.getsource(obj)))
+            except (OSError, TypeError):
+                parts.append((label, sorted(vars(obj))))
+            for value in vars(obj).values():
+                if hasattr(value, '__code__') or isinstance(value, (staticmethod, classmethod)):
+                    visit(label, value)
+        elif isinstance(obj, FINGERPRINT_CONSTANTS):
+            parts.append((label, repr(obj)))
+    
+    visit(func.__qualname__, func)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+def style_fingerprint():
+    """Hash the global matplotlib style (rcParams set by sns.set_style and friends)"""
+    style = sorted((key, repr(value)) for key, value in plt.rcParams.items()
+                   if not key.startswith('backend'))
+    return hashlib.sha256(repr(style).encode()).hexdigest()
+
+def profile_from_argv(argv):
+    """Return 'publication' when --publication is on the command line"""
+    return 'publication' if '--publication' in argv else DEFAULT_PROFILE
+
+def save_figure(fig, output_path, profile=DEFAULT_PROFILE):
+    """Save a figure with the settings of a render profile and close it"""
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile '{profile}'. "
+                         f"Choose from: {', '.join(RENDER_PROFILES)}")
+    fig.savefig(output_path, **RENDER_PROFILES[profile])
+    plt.close(fig)
+    return output_path
+
+def render_figure(draw, data, output_path, profile=DEFAULT_PROFILE):
+    """Draw a figure from its data and save it with a render profile"""
+    return save_figure(draw(data), output_path, profile)
+
+def init_render_worker():
+    """Use the non-interactive Agg backend in rendering worker processes"""
+    plt.switch_backend('Agg')
+
+class FigureCache:
+    """Content-addressed store of rendered figures with JSON metadata sidecars
+    
+    Only the latest render of each figure is kept per render profile:
+    storing a new render evicts older entries for the same output path and
+    profile, so the cache stays bounded by figures x profiles.
+    """
+    
+    def __init__(self, cache_dir='images/.cache'):
+        """Use cache_dir for cached images and their sidecars"""
+        self.cache_dir = cache_dir
+    
+    def key(self, draw, data, profile, **params):
+        """Hash the plotted data, drawing code, parameters and render settings
+        
+        The drawing code includes every project function draw delegates to,
+        and the global matplotlib style is hashed alongside it.
+        """
+        payload = pickle.dumps((
+            CACHE_VERSION,
+            draw.__name__,
+            code_fingerprint(draw),
+            style_fingerprint(),
+            data,
+            sorted(params.items()),
+            profile,
+            sorted(RENDER_PROFILES[profile].items(), key=lambda item: item[0]),
+        ), protocol=4)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def _paths(self, key, output_path):
+        """Return the cached image and sidecar paths for a key"""
+        ext = os.path.splitext(output_path)[1] or '.png'
+        base = os.path.join(self.cache_dir, key)
+        return base + ext, base + '.json'
+    
+    def restore(self, key, output_path):
+        """Copy a cached figure to output_path; return False on a cache miss"""
+        image_path, _ = self._paths(key, output_path)
+        if not os.path.exists(image_path):
+            return False
+        shutil.copyfile(image_path, output_path)
+        return True
+    
+    def store(self, key, output_path, draw, profile, **params):
+        """Add a freshly rendered figure and its metadata to the cache"""
+        image_path, sidecar_path = self._paths(key, output_path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        shutil.copyfile(output_path, image_path)
+        
+        metadata = {
+            'key': key,
+            'figure': output_path,
+            'draw_function': draw.__name__,
+            'params': params,
+            'profile': profile,
+            'render_settings': RENDER_PROFILES[profile],
+            'cache_version': CACHE_VERSION,
+            'bytes': os.path.getsize(image_path),
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        with open(sidecar_path, 'w') as f:
+            json.dump(metadata, f, indent=2, default=str)
+        
+        self.prune(output_path, profile, keep=key)
+        return image_path
+    
+    def prune(self, output_path, profile, keep=None):
+        """Remove cached renders of output_path with this profile, except key keep
+        
+        Returns the number of evicted entries.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        
+        evicted = 0
+        for name in os.listdir(self.cache_dir):
+            key, ext = os.path.splitext(name)
+            if ext != '.json' or key == keep:
+                continue
+            sidecar_path = os.path.join(self.cache_dir, name)
+            try:
+                with open(sidecar_path) as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if metadata.get('figure') != output_path or metadata.get('profile') != profile:
+                continue
+            
+            image_path, _ = self._paths(key, output_path)
+            for path in (image_path, sidecar_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            evicted += 1
+        return evicted
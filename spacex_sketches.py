@@ -0,0 +1,337 @@
+"""
+SpaceX Falcon 9 First Stage Landing Prediction
+Mergeable sketches for approximate summary statistics
+
+These sketches summarize a launch archive in bounded memory. Each one is
+built per chunk, merged with sketches of other chunks, and saved as JSON:
+  
+  HyperLogLog     - distinct counts (launch sites, orbits)
+  CountMinSketch  - frequency estimates for the most common orbits
+  KLLSketch       - quantiles of PayloadMass
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+def _hash_values(values, seed=0):
+    """Vectorized 64-bit hash of arbitrary values"""
+    values = np.asarray(values, dtype=object)
+    return pd.util.hash_array(values, hash_key=f"spacex-sketch{seed:03d}")
+
+class HyperLogLog:
+    """HyperLogLog distinct counter (about 1.6% standard error at p=12)"""
+    
+    def __init__(self, p=12, registers=None):
+        """Create a sketch with 2**p registers"""
+        self.p = p
+        self.m = 1 << p
+        self.registers = (np.zeros(self.m, dtype=np.uint8) if registers is None
+                          else np.asarray(registers, dtype=np.uint8))
+    
+    def update(self, values):
+        """Add a batch of values"""
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return self
+        hashes = _hash_values(values)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # rest < 2**52 is exact as float64, so frexp gives its bit length
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (64 - self.p) - bit_length + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+    
+    def merge(self, other):
+        """Fold in a sketch with the same precision"""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+    
+    def estimate(self):
+        """Return the estimated number of distinct values"""
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * self.m and zeros:
+            # Small-range correction (linear counting)
+            return self.m * np.log(self.m / zeros)
+        return raw
+    
+    def to_dict(self):
+        """Serialize to a JSON-friendly dict"""
+        return {'p': self.p, 'registers': self.registers.tolist()}
+    
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from to_dict output"""
+        return cls(state['p'], state['registers'])
+
+class CountMinSketch:
+    """Count-Min frequency sketch with a bounded candidate set for top-k queries"""
+    
+    def __init__(self, width=2048, depth=5, max_candidates=64, table=None, candidates=None):
+        """Create a depth x width counter table"""
+        self.width = width
+        self.depth = depth
+        self.max_candidates = max_candidates
+        self.table = (np.zeros((depth, width), dtype=np.int64) if table is None
+                      else np.asarray(table, dtype=np.int64))
+        self.candidates = set(candidates or [])
+    
+    def update(self, values):
+        """Add a batch of values"""
+        values = pd.Series(values).dropna().astype(str)
+        if values.empty:
+            return self
+        for row in range(self.depth):
+            columns = (_hash_values(values, seed=row + 1) % np.uint64(self.width)).astype(np.int64)
+            np.add.at(self.table[row], columns, 1)
+        self.candidates.update(values.value_counts().index[:self.max_candidates])
+        self._trim_candidates()
+        return self
+    
+    def merge(self, other):
+        """Fold in a sketch with the same dimensions"""
+        self.table += other.table
+        self.candidates.update(other.candidates)
+        self._trim_candidates()
+        return self
+    
+    def estimate(self, value):
+        """Return the (over-)estimated count of a value"""
+        values = np.array([str(value)], dtype=object)
+        return int(min(
+            self.table[row, int(_hash_values(values, seed=row + 1)[0] % np.uint64(self.width))]
+            for row in range(self.depth)
+        ))
+    
+    def top(self, k=5):
+        """Return the k most frequent candidate values with estimated counts"""
+        counts = [(value, self.estimate(value)) for value in self.candidates]
+        return sorted(counts, key=lambda item: (-item[1], item[0]))[:k]
+    
+    def _trim_candidates(self):
+        """Keep only the max_candidates values with the highest estimates"""
+        if len(self.candidates) > self.max_candidates:
+            self.candidates = {value for value, _ in self.top(self.max_candidates)}
+    
+    def to_dict(self):
+        """Serialize to a JSON-friendly dict"""
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'max_candidates': self.max_candidates,
+            'table': self.table.tolist(),
+            'candidates': sorted(self.candidates),
+        }
+    
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from to_dict output"""
+        return cls(state['width'], state['depth'], state['max_candidates'],
+                   state['table'], state['candidates'])
+
+class KLLSketch:
+    """KLL quantile sketch (rank error around 1% with k=200)"""
+    
+    def __init__(self, k=200, levels=None, seed=0):
+        """Create an empty sketch; level h holds items of weight 2**h"""
+        self.k = k
+        self.levels = [np.asarray(level, dtype=np.float64) for level in (levels or [[]])]
+        self._rng = np.random.default_rng(seed)
+    
+    def _capacity(self, level):
+        """Capacity of a level, shrinking by 2/3 below the top level"""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _compress(self):
+        """Compact any level over capacity, promoting half its items"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep an odd leftover at this level so weights stay exact
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                level = 0
+            else:
+                level += 1
+    
+    def update(self, values):
+        """Add a batch of values"""
+        values = np.asarray(pd.Series(values).dropna(), dtype=np.float64)
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+    
+    def merge(self, other):
+        """Fold in another sketch"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+    
+    def quantiles(self, qs):
+        """Return approximate values at the given quantiles (0..1)"""
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return [float('nan')] * len(qs)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items)
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(qs) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, targets), len(items) - 1)
+        return items[order][positions].tolist()
+    
+    def to_dict(self):
+        """Serialize to a JSON-friendly dict"""
+        return {'k': self.k, 'levels': [level.tolist() for level in self.levels]}
+    
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild a sketch from to_dict output"""
+        return cls(state['k'], state['levels'])
+
+class LaunchSketches:
+    """Bundle of sketches plus exact mergeable totals for one launch archive"""
+    
+    def __init__(self):
+        """Start with empty sketches"""
+        self.launches = 0
+        self.successes = 0
+        self.date_min = None
+        self.date_max = None
+        self.payload_count = 0
+        self.payload_sum = 0.0
+        self.payload_min = None
+        self.payload_max = None
+        self.sites = HyperLogLog()
+        self.orbits = HyperLogLog()
+        self.orbit_counts = CountMinSketch()
+        self.payload = KLLSketch()
+        self.source = {}
+    
+    def update(self, chunk):
+        """Add one DataFrame chunk of launches"""
+        self.launches += len(chunk)
+        self.successes += int(chunk['Class'].sum())
+        
+        dates = chunk['Date'].dropna().astype(str)
+        if not dates.empty:
+            self.date_min = min(filter(None, [self.date_min, dates.min()]))
+            self.date_max = max(filter(None, [self.date_max, dates.max()]))
+        
+        self.sites.update(chunk['LaunchSite'])
+        self.orbits.update(chunk['Orbit'])
+        self.orbit_counts.update(chunk['Orbit'])
+        
+        if 'PayloadMass' in chunk.columns:
+            payload = chunk['PayloadMass'][chunk['PayloadMass'] > 0]
+            if not payload.empty:
+                self.payload_count += len(payload)
+                self.payload_sum += float(payload.sum())
+                self.payload_min = min(filter(lambda v: v is not None, [self.payload_min, float(payload.min())]))
+                self.payload_max = max(filter(lambda v: v is not None, [self.payload_max, float(payload.max())]))
+                self.payload.update(payload)
+        return self
+    
+    def merge(self, other):
+        """Fold in sketches built over another partition"""
+        self.launches += other.launches
+        self.successes += other.successes
+        self.date_min = min(filter(None, [self.date_min, other.date_min]), default=None)
+        self.date_max = max(filter(None, [self.date_max, other.date_max]), default=None)
+        self.payload_count += other.payload_count
+        self.payload_sum += other.payload_sum
+        mins = [v for v in (self.payload_min, other.payload_min) if v is not None]
+        maxs = [v for v in (self.payload_max, other.payload_max) if v is not None]
+        self.payload_min = min(mins) if mins else None
+        self.payload_max = max(maxs) if maxs else None
+        self.sites.merge(other.sites)
+        self.orbits.merge(other.orbits)
+        self.orbit_counts.merge(other.orbit_counts)
+        self.payload.merge(other.payload)
+        return self
+    
+    @classmethod
+    def from_csv(cls, path, chunksize=1000000):
+        """Build sketches in one chunked pass over a CSV file"""
+        sketches = cls()
+        columns = ['Date', 'LaunchSite', 'Orbit', 'Class', 'PayloadMass']
+        header = pd.read_csv(path, nrows=0).columns
+        for chunk in pd.read_csv(path, usecols=[c for c in columns if c in header],
+                                 chunksize=chunksize):
+            sketches.update(chunk)
+        sketches.source = source_fingerprint(path)
+        return sketches
+    
+    def summary(self):
+        """Return the approximate summary statistics"""
+        q25, q50, q75 = self.payload.quantiles([0.25, 0.5, 0.75])
+        return {
+            'launches': self.launches,
+            'successes': self.successes,
+            'success_rate': self.successes / self.launches * 100 if self.launches else 0.0,
+            'date_min': self.date_min,
+            'date_max': self.date_max,
+            'unique_sites': int(round(self.sites.estimate())),
+            'unique_orbits': int(round(self.orbits.estimate())),
+            'top_orbits': self.orbit_counts.top(5),
+            'payload_mean': self.payload_sum / self.payload_count if self.payload_count else None,
+            'payload_min': self.payload_min,
+            'payload_max': self.payload_max,
+            'payload_quartiles': [q25, q50, q75],
+        }
+    
+    def save(self, path):
+        """Persist all sketches as JSON"""
+        state = {
+            'source': self.source,
+            'launches': self.launches,
+            'successes': self.successes,
+            'date_min': self.date_min,
+            'date_max': self.date_max,
+            'payload_count': self.payload_count,
+            'payload_sum': self.payload_sum,
+            'payload_min': self.payload_min,
+            'payload_max': self.payload_max,
+            'sites': self.sites.to_dict(),
+            'orbits': self.orbits.to_dict(),
+            'orbit_counts': self.orbit_counts.to_dict(),
+            'payload': self.payload.to_dict(),
+        }
+        with open(path, 'w') as f:
+            json.dump(state, f)
+        return path
+    
+    @classmethod
+    def load(cls, path):
+        """Load sketches saved with save()"""
+        with open(path) as f:
+            state = json.load(f)
+        sketches = cls()
+        for name in ['source', 'launches', 'successes', 'date_min', 'date_max', 'payload_count',
+                     'payload_sum', 'payload_min', 'payload_max']:
+            setattr(sketches, name, state[name])
+        sketches.sites = HyperLogLog.from_dict(state['sites'])
+        sketches.orbits = HyperLogLog.from_dict(state['orbits'])
+        sketches.orbit_counts = CountMinSketch.from_dict(state['orbit_counts'])
+        sketches.payload = KLLSketch.from_dict(state['payload'])
+        return sketches
+
+def source_fingerprint(path):
+    """Identify a data file by path, size and modification time"""
+    stat = os.stat(path)
+    return {'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime}
@@ -8,16 +8,87 @@ to extract insights and patterns.
 
 import pandas as pd
 import sqlite3
+import json
+import os
+import re
+import sys
+import time
 from datetime import datetime
+from spacex_launchpads import get_registry, REGISTRY_PATH
 
 class SpaceXSQLAnalysis:
     """Class for SQL-based analysis of SpaceX launch data"""
     
-    def __init__(self, data_path='data/spacex_launch_data.csv', db_name='data/spacex.db'):
-        """Initialize SQL analysis"""
+    # Number of SQLite VM instructions between progress handler callbacks
+    PROGRESS_STEP = 100
+    
+    # Maximum rows printed to the console for any query result
+    PREVIEW_ROWS = 20
+    
+    # Rows fetched per batch when streaming query results
+    STREAM_CHUNKSIZE = 10000
+    
+    # Text columns indexed by the SPACEX_FTS trigram full-text table
+    FTS_COLUMNS = ['Name', 'PayloadType', 'Rocket']
+    
+    # Words that can follow a table name in FROM/JOIN without being an alias
+    SQL_KEYWORDS = {
+        'WHERE', 'GROUP', 'ORDER', 'LIMIT', 'JOIN', 'INNER', 'LEFT', 'RIGHT', 'CROSS',
+        'NATURAL', 'ON', 'USING', 'UNION', 'EXCEPT', 'INTERSECT', 'WINDOW', 'HAVING', 'AS',
+    }
+    
+    # Number of launches in the rolling success-rate window per site
+    ROLLING_WINDOW = 10
+    
+    # Rollup dimensions and the row expression each one groups on
+    SUMMARY_DIMENSIONS = {
+        'LaunchSite': "COALESCE({row}.LaunchSite, 'Unknown')",
+        'Orbit': "COALESCE({row}.Orbit, 'Unknown')",
+        'Year': "COALESCE(SUBSTR({row}.Date, 1, 4), 'Unknown')",
+    }
+    
+    # Materialized summary tables maintained by triggers on SPACEXDATASET
+    SUMMARY_TABLES = {
+        'SUMMARY_SITE': ['LaunchSite'],
+        'SUMMARY_ORBIT': ['Orbit'],
+        'SUMMARY_YEAR': ['Year'],
+        'SUMMARY_SITE_ORBIT': ['LaunchSite', 'Orbit'],
+        'SUMMARY_SITE_YEAR': ['LaunchSite', 'Year'],
+        'SUMMARY_ORBIT_YEAR': ['Orbit', 'Year'],
+    }
+    
+    # Schema version stamped into PRAGMA user_version; bump it whenever the
+    # tables, views or indexes created by create_database change
+    SCHEMA_VERSION = 2
+    
+    # Objects a snapshot must contain to be restored instead of rebuilt
+    REQUIRED_OBJECTS = [
+        'SPACEXDATASET', *SUMMARY_TABLES,
+        'V_SITE_SUCCESS_TRENDS', 'V_LAUNCH_STREAKS',
+        'LAUNCHPADS', 'LAUNCHPAD_KEYS',
+    ]
+    
+    def __init__(self, data_path='data/spacex_launch_data.csv', db_name='data/spacex.db',
+                 in_memory=False):
+        """Initialize SQL analysis
+        
+        With in_memory=True the database lives in ':memory:' and db_name is
+        only used as the snapshot file for save_snapshot/restore_snapshot.
+        """
         self.data_path = data_path
         self.db_name = db_name
+        self.in_memory = in_memory
         self.conn = None
+        self.fts_enabled = False
+        self.query_profiles = []
+        self.query_results = {}
+        self.query_row_counts = {}
+    
+    def load_database(self):
+        """Restore a fresh in-memory snapshot if available, else build from CSV"""
+        if self.in_memory and self.snapshot_is_fresh():
+            return self.restore_snapshot()
+        return self.create_database()
         
     def create_database(self):
         """Create SQLite database from CSV data"""
@@ -27,97 +98,688 @@ class SpaceXSQLAnalysis:
         df = pd.read_csv(self.data_path)
         
         # Create database connection
-        self.conn = sqlite3.connect(self.db_name)
+        self.conn = sqlite3.connect(':memory:' if self.in_memory else self.db_name)
         
         # Write to database
         df.to_sql('SPACEXDATASET', self.conn, if_exists='replace', index=False)
         
-        print(f"✓ Database created: {self.db_name}")
+        print(f"✓ Database created: {':memory:' if self.in_memory else self.db_name}")
         print(f"✓ Table 'SPACEXDATASET' created with {len(df)} records")
         
+        self.create_summary_tables()
+        self.create_search_index()
+        self.create_analytics_views()
+        self.create_launchpad_tables()
+        
+        self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.commit()
+        
+        return self.conn
+    
+    def snapshot_is_fresh(self, snapshot_path=None):
+        """Check whether a snapshot can be restored instead of rebuilding from CSV
+        
+        The snapshot must be newer than the CSV data and the launchpad
+        registry (both are baked into it), carry the current SCHEMA_VERSION
+        and contain every object in REQUIRED_OBJECTS.
+        """
+        snapshot_path = snapshot_path or self.db_name
+        if not os.path.exists(snapshot_path):
+            return False
+        
+        snapshot_time = os.path.getmtime(snapshot_path)
+        for source in (self.data_path, REGISTRY_PATH):
+            if os.path.exists(source) and os.path.getmtime(source) > snapshot_time:
+                return False
+        
+        return self.snapshot_schema_matches(snapshot_path)
+    
+    def snapshot_schema_matches(self, snapshot_path=None):
+        """Check a snapshot's schema version and required tables and views"""
+        snapshot_path = snapshot_path or self.db_name
+        try:
+            source = sqlite3.connect(f"file:{snapshot_path}?mode=ro", uri=True)
+            try:
+                version = source.execute("PRAGMA user_version").fetchone()[0]
+                names = {row[0] for row in source.execute("SELECT name FROM sqlite_master")}
+            finally:
+                source.close()
+        except sqlite3.DatabaseError as e:
+            print(f"⚠ Snapshot {snapshot_path} is unreadable ({e}); rebuilding from CSV")
+            return False
+        
+        missing = [name for name in self.REQUIRED_OBJECTS if name not in names]
+        if version != self.SCHEMA_VERSION or missing:
+            print(f"⚠ Snapshot {snapshot_path} has schema version {version} "
+                  f"(expected {self.SCHEMA_VERSION})"
+                  + (f" and lacks {', '.join(missing)}" if missing else "")
+                  + "; rebuilding from CSV")
+            return False
+        return True
+    
+    def save_snapshot(self, snapshot_path=None):
+        """Copy the current database to disk with the sqlite3 backup API"""
+        snapshot_path = snapshot_path or self.db_name
+        
+        target = sqlite3.connect(snapshot_path)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
+        
+        print(f"✓ Database snapshot saved: {snapshot_path}")
+        return snapshot_path
+    
+    def restore_snapshot(self, snapshot_path=None):
+        """Load a database snapshot from disk into memory"""
+        snapshot_path = snapshot_path or self.db_name
+        print(f"Restoring database snapshot from {snapshot_path}...")
+        
+        source = sqlite3.connect(snapshot_path)
+        try:
+            self.conn = sqlite3.connect(':memory:')
+            source.backup(self.conn)
+        finally:
+            source.close()
+        
+        count = self.conn.execute("SELECT COUNT(*) FROM SPACEXDATASET").fetchone()[0]
+        self.fts_enabled = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'SPACEX_FTS'"
+        ).fetchone() is not None
+        print(f"✓ Snapshot restored into memory with {count} records")
+        
         return self.conn
     
-    def execute_query(self, query, description=""):
-        """Execute SQL query and display results"""
+    def _summary_counts(self, row):
+        """Return the launch, attempt and success count expressions for a row"""
+        return [
+            "1",
+            f"CASE WHEN {row}.LandingAttempt = 1 THEN 1 ELSE 0 END",
+            f"CASE WHEN {row}.LandingAttempt = 1 AND {row}.LandingSuccess = 1 THEN 1 ELSE 0 END",
+        ]
+    
+    def create_summary_tables(self):
+        """Create success-rate summary tables kept up to date by triggers"""
+        count_columns = ['TotalLaunches', 'LandingAttempts', 'SuccessfulLandings']
+        statements = []
+        
+        for table, dimensions in self.SUMMARY_TABLES.items():
+            keys = ", ".join(dimensions)
+            columns = ", ".join(dimensions + count_columns)
+            
+            def key_values(row):
+                return ", ".join(self.SUMMARY_DIMENSIONS[d].format(row=row) for d in dimensions)
+            
+            def key_match(row):
+                return " AND ".join(
+                    f"{d} = {self.SUMMARY_DIMENSIONS[d].format(row=row)}" for d in dimensions
+                )
+            
+            add_row = (
+                f"INSERT INTO {table} ({columns}) "
+                f"VALUES ({key_values('NEW')}, {', '.join(self._summary_counts('NEW'))}) "
+                f"ON CONFLICT ({keys}) DO UPDATE SET "
+                + ", ".join(f"{c} = {c} + excluded.{c}" for c in count_columns)
+                + ";"
+            )
+            remove_row = (
+                f"UPDATE {table} SET "
+                + ", ".join(
+                    f"{c} = {c} - ({expr})"
+                    for c, expr in zip(count_columns, self._summary_counts('OLD'))
+                )
+                + f" WHERE {key_match('OLD')};"
+                + f" DELETE FROM {table} WHERE TotalLaunches <= 0 AND {key_match('OLD')};"
+            )
+            
+            # Initial population in one grouped pass, then incremental triggers
+            statements.append(f"""
+                DROP TABLE IF EXISTS {table};
+                CREATE TABLE {table} (
+                    {", ".join(f"{d} TEXT NOT NULL" for d in dimensions)},
+                    TotalLaunches INTEGER NOT NULL DEFAULT 0,
+                    LandingAttempts INTEGER NOT NULL DEFAULT 0,
+                    SuccessfulLandings INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY ({keys})
+                );
+                INSERT INTO {table} ({columns})
+                SELECT {key_values('s')}, {", ".join(f"SUM({e})" for e in self._summary_counts('s'))}
+                FROM SPACEXDATASET s
+                GROUP BY {key_values('s')};
+                
+                CREATE TRIGGER IF NOT EXISTS trg_{table.lower()}_insert
+                AFTER INSERT ON SPACEXDATASET
+                BEGIN {add_row} END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_{table.lower()}_delete
+                AFTER DELETE ON SPACEXDATASET
+                BEGIN {remove_row} END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_{table.lower()}_update
+                AFTER UPDATE OF LaunchSite, Orbit, Date, LandingAttempt, LandingSuccess ON SPACEXDATASET
+                BEGIN {remove_row} {add_row} END;
+            """)
+        
+        self.conn.executescript("\n".join(statements))
+        print(f"✓ Created {len(self.SUMMARY_TABLES)} trigger-maintained summary tables")
+    
+    def create_launchpad_tables(self):
+        """Load the launchpad registry into LAUNCHPADS and its key index LAUNCHPAD_KEYS
+        
+        LAUNCHPAD_KEYS maps every launchpad id, name and alias to its id, so
+        LaunchSite values of any form join to coordinates with one lookup.
+        """
+        registry = get_registry()
+        pads = registry.pads
+        self.conn.executescript("""
+            DROP TABLE IF EXISTS LAUNCHPADS;
+            DROP TABLE IF EXISTS LAUNCHPAD_KEYS;
+            CREATE TABLE LAUNCHPADS (
+                LaunchpadId TEXT PRIMARY KEY,
+                Name TEXT,
+                FullName TEXT,
+                Locality TEXT,
+                Region TEXT,
+                Latitude REAL,
+                Longitude REAL
+            );
+            CREATE TABLE LAUNCHPAD_KEYS (
+                Key TEXT PRIMARY KEY,
+                LaunchpadId TEXT NOT NULL REFERENCES LAUNCHPADS (LaunchpadId)
+            );
+        """)
+        self.conn.executemany(
+            "INSERT INTO LAUNCHPADS VALUES (?, ?, ?, ?, ?, ?, ?);",
+            pads[['id', 'name', 'full_name', 'locality', 'region', 'latitude', 'longitude']]
+            .itertuples(index=False, name=None)
+        )
+        # Registry keys plus the data's own LaunchSite spellings
+        sites = pd.read_sql_query("SELECT DISTINCT LaunchSite FROM SPACEXDATASET;", self.conn)['LaunchSite']
+        site_keys = pd.DataFrame({'key': sites, 'launchpad_id': registry.resolve(sites)}).dropna()
+        keys = pd.concat([registry.lookup_table(), site_keys])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO LAUNCHPAD_KEYS VALUES (?, ?);",
+            keys.itertuples(index=False, name=None)
+        )
+        self.conn.commit()
+        print(f"✓ Created LAUNCHPADS table with {len(registry)} launchpads")
+    
+    def create_search_index(self):
+        """Create a trigram FTS5 index over the text columns, synced by triggers
+        
+        Falls back to plain LIKE filters when this SQLite build lacks FTS5
+        or the trigram tokenizer (SQLite < 3.34).
+        """
+        columns = [c for c in self.FTS_COLUMNS if self._has_column(c)]
+        names = ", ".join(columns)
+        new_values = ", ".join(f"new.{c}" for c in columns)
+        old_values = ", ".join(f"old.{c}" for c in columns)
+        
+        add_row = f"INSERT INTO SPACEX_FTS (rowid, {names}) VALUES (new.rowid, {new_values});"
+        remove_row = (
+            f"INSERT INTO SPACEX_FTS (SPACEX_FTS, rowid, {names}) "
+            f"VALUES ('delete', old.rowid, {old_values});"
+        )
+        
+        try:
+            self.conn.executescript(f"""
+                DROP TABLE IF EXISTS SPACEX_FTS;
+                CREATE VIRTUAL TABLE SPACEX_FTS USING fts5(
+                    {names},
+                    content='SPACEXDATASET', content_rowid='rowid', tokenize='trigram'
+                );
+                INSERT INTO SPACEX_FTS (SPACEX_FTS) VALUES ('rebuild');
+                
+                CREATE TRIGGER IF NOT EXISTS trg_spacex_fts_insert
+                AFTER INSERT ON SPACEXDATASET
+                BEGIN {add_row} END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_spacex_fts_delete
+                AFTER DELETE ON SPACEXDATASET
+                BEGIN {remove_row} END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_spacex_fts_update
+                AFTER UPDATE OF {names} ON SPACEXDATASET
+                BEGIN {remove_row} {add_row} END;
+            """)
+        except sqlite3.OperationalError as e:
+            self.fts_enabled = False
+            print(f"⚠ Full-text index unavailable ({e}); using LIKE for text searches")
+            return False
+        
+        self.fts_enabled = True
+        print(f"✓ Full-text index 'SPACEX_FTS' created over {names}")
+        return True
+    
+    def create_analytics_views(self):
+        """Create window-function views for time-series analytics
+        
+        V_SITE_SUCCESS_TRENDS  - cumulative and rolling success rate per site
+        V_CORE_REUSE           - flight number of each booster core
+        V_LAUNCH_STREAKS       - launches since the last failed landing
+        """
+        preceding = self.ROLLING_WINDOW - 1
+        statements = [f"""
+            CREATE INDEX IF NOT EXISTS idx_spacex_site_date
+                ON SPACEXDATASET (LaunchSite, Date, FlightNumber);
+            CREATE INDEX IF NOT EXISTS idx_spacex_date
+                ON SPACEXDATASET (Date, FlightNumber);
+            
+            DROP VIEW IF EXISTS V_SITE_SUCCESS_TRENDS;
+            CREATE VIEW V_SITE_SUCCESS_TRENDS AS
+            SELECT
+                LaunchSite, Date, FlightNumber, Name, LandingAttempt, LandingSuccess,
+                SiteLaunchNumber, SiteLaunches,
+                ROUND(100.0 * CumulativeSuccesses / NULLIF(CumulativeAttempts, 0), 2) as CumulativeSuccessRate,
+                ROUND(100.0 * RollingSuccesses / NULLIF(RollingAttempts, 0), 2) as RollingSuccessRate
+            FROM (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER site_order as SiteLaunchNumber,
+                    COUNT(*) OVER (PARTITION BY LaunchSite) as SiteLaunches,
+                    SUM(CASE WHEN LandingAttempt = 1 THEN 1 ELSE 0 END)
+                        OVER (site_order ROWS UNBOUNDED PRECEDING) as CumulativeAttempts,
+                    SUM(CASE WHEN LandingAttempt = 1 AND LandingSuccess = 1 THEN 1 ELSE 0 END)
+                        OVER (site_order ROWS UNBOUNDED PRECEDING) as CumulativeSuccesses,
+                    SUM(CASE WHEN LandingAttempt = 1 THEN 1 ELSE 0 END)
+                        OVER (site_order ROWS BETWEEN {preceding} PRECEDING AND CURRENT ROW) as RollingAttempts,
+                    SUM(CASE WHEN LandingAttempt = 1 AND LandingSuccess = 1 THEN 1 ELSE 0 END)
+                        OVER (site_order ROWS BETWEEN {preceding} PRECEDING AND CURRENT ROW) as RollingSuccesses
+                FROM SPACEXDATASET
+                WINDOW site_order AS (PARTITION BY LaunchSite ORDER BY Date, FlightNumber)
+            );
+            
+            DROP VIEW IF EXISTS V_LAUNCH_STREAKS;
+            CREATE VIEW V_LAUNCH_STREAKS AS
+            SELECT
+                Date, FlightNumber, Name, LaunchSite, LandingAttempt, LandingSuccess,
+                PriorFailures,
+                COUNT(*) OVER (
+                    PARTITION BY PriorFailures ORDER BY Date, FlightNumber ROWS UNBOUNDED PRECEDING
+                ) - 1 as LaunchesSinceLastFailure
+            FROM (
+                SELECT
+                    *,
+                    COALESCE(SUM(CASE WHEN LandingAttempt = 1 AND LandingSuccess = 0 THEN 1 ELSE 0 END) OVER (
+                        ORDER BY Date, FlightNumber ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                    ), 0) as PriorFailures
+                FROM SPACEXDATASET
+            );
+        """]
+        
+        if self._has_column('Core'):
+            statements.append("""
+                CREATE INDEX IF NOT EXISTS idx_spacex_core_date
+                    ON SPACEXDATASET (Core, Date, FlightNumber);
+                
+                DROP VIEW IF EXISTS V_CORE_REUSE;
+                CREATE VIEW V_CORE_REUSE AS
+                SELECT
+                    Core, Date, FlightNumber, Name, LaunchSite, LandingSuccess,
+                    ROW_NUMBER() OVER core_order as CoreFlightNumber,
+                    COUNT(*) OVER (PARTITION BY Core) as CoreTotalFlights,
+                    SUM(CASE WHEN LandingSuccess = 1 THEN 1 ELSE 0 END)
+                        OVER (core_order ROWS UNBOUNDED PRECEDING) as CoreLandingsToDate
+                FROM SPACEXDATASET
+                WHERE Core IS NOT NULL
+                WINDOW core_order AS (PARTITION BY Core ORDER BY Date, FlightNumber);
+            """)
+        
+        self.conn.executescript("\n".join(statements))
+        print("✓ Window-function analytics views created")
+    
+    def _has_column(self, column):
+        """Check whether SPACEXDATASET has the given column"""
+        columns = self.conn.execute("PRAGMA table_info(SPACEXDATASET)").fetchall()
+        return any(col[1] == column for col in columns)
+    
+    def text_filter(self, column, term):
+        """Return a WHERE condition matching rows whose column contains term
+        
+        Uses the SPACEX_FTS trigram index when available. Terms shorter than
+        three characters cannot use trigrams and fall back to LIKE.
+        """
+        if self.fts_enabled and column in self.FTS_COLUMNS and len(term) >= 3:
+            phrase = term.replace('"', '""').replace("'", "''")
+            return f"rowid IN (SELECT rowid FROM SPACEX_FTS WHERE SPACEX_FTS MATCH '{column} : \"{phrase}\"')"
+        
+        pattern = term.replace("'", "''")
+        return f"{column} LIKE '%{pattern}%'"
+    
+    def search_launches(self, term, column='Name', columns="*"):
+        """Find launches whose column contains term"""
+        query = f"SELECT {columns} FROM SPACEXDATASET WHERE {self.text_filter(column, term)};"
+        return self.execute_query(query, f"Launches with {column} containing '{term}'")
+    
+    def execute_query(self, query, description="", output_path=None):
+        """Execute SQL query and display results
+        
+        When output_path is given the result is streamed to that CSV or
+        Parquet file and only a preview DataFrame is returned.
+        """
         if description:
             print(f"\n{description}")
             print("-" * 70)
         
         print(f"Query: {query}\n")
         
-        result = pd.read_sql_query(query, self.conn)
-        print(result)
-        print(f"\nRows returned: {len(result)}")
+        if output_path:
+            result, total_rows = self._profiled_query(
+                query, description,
+                run=lambda q: self.export_query(q, output_path)
+            )
+        else:
+            result = self._profiled_query(query, description)
+            total_rows = len(result)
+        
+        self.print_preview(result, total_rows)
+        if output_path:
+            print(f"✓ Full result written to {output_path}")
+        
+        return result
+    
+    def print_preview(self, result, total_rows=None):
+        """Print at most PREVIEW_ROWS rows of a result"""
+        total_rows = len(result) if total_rows is None else total_rows
+        print(result.head(self.PREVIEW_ROWS))
+        if total_rows > self.PREVIEW_ROWS:
+            print(f"... ({total_rows - self.PREVIEW_ROWS} more rows not shown)")
+        print(f"\nRows returned: {total_rows}")
+    
+    def stream_query(self, query, chunksize=None):
+        """Yield query results as DataFrame batches fetched from a cursor"""
+        chunksize = chunksize or self.STREAM_CHUNKSIZE
+        cursor = self.conn.execute(query)
+        columns = [col[0] for col in cursor.description]
+        try:
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=columns)
+        finally:
+            cursor.close()
+    
+    def result_schema(self, query, sample):
+        """Return the Arrow schema of a query result for Parquet output
+        
+        Column types come from the declared SQLite types of the result
+        columns (read through a temporary view), so they do not depend on
+        which values happen to be in the first batch. Computed columns
+        without a declared type use the type of the sample DataFrame, and
+        columns that are all NULL in the sample take the type of their first
+        non-NULL value in the full result.
+        """
+        import pyarrow as pa
+        
+        sample_schema = pa.Table.from_pandas(sample, preserve_index=False).schema
+        self.conn.execute(f"CREATE TEMP VIEW _export_result AS {query.rstrip().rstrip(';')}")
+        try:
+            declared = self.conn.execute("PRAGMA table_info(_export_result)").fetchall()
+            fields = []
+            for field, (_, view_column, decltype, *_) in zip(sample_schema, declared):
+                arrow_type = self._arrow_type(decltype) or field.type
+                if pa.types.is_null(arrow_type):
+                    value = self.conn.execute(
+                        f'SELECT "{view_column}" FROM _export_result '
+                        f'WHERE "{view_column}" IS NOT NULL LIMIT 1'
+                    ).fetchone()
+                    if value is not None:
+                        arrow_type = pa.array(value).type
+                fields.append(pa.field(field.name, arrow_type))
+        finally:
+            self.conn.execute("DROP VIEW IF EXISTS _export_result")
+        return pa.schema(fields)
+    
+    @staticmethod
+    def _arrow_type(decltype):
+        """Map a declared SQLite column type to an Arrow type by SQLite's affinity rules"""
+        import pyarrow as pa
+        
+        decltype = (decltype or '').upper()
+        if not decltype:
+            return None
+        if 'INT' in decltype:
+            return pa.int64()
+        if any(t in decltype for t in ('CHAR', 'CLOB', 'TEXT')):
+            return pa.string()
+        if 'BLOB' in decltype:
+            return pa.binary()
+        if any(t in decltype for t in ('REAL', 'FLOA', 'DOUB')):
+            return pa.float64()
+        return None
+    
+    def export_query(self, query, output_path, chunksize=None):
+        """Stream a query result to a CSV or Parquet file
+        
+        Returns a preview DataFrame of the first PREVIEW_ROWS rows and the
+        total number of rows written. A partially written file is removed
+        if the export fails.
+        """
+        parquet = output_path.endswith('.parquet')
+        if parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        writer = None
+        preview = None
+        total_rows = 0
+        
+        try:
+            try:
+                for chunk in self.stream_query(query, chunksize):
+                    if preview is None:
+                        preview = chunk.head(self.PREVIEW_ROWS)
+                    
+                    if parquet:
+                        if writer is None:
+                            writer = pq.ParquetWriter(output_path, self.result_schema(query, chunk))
+                        writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+                    else:
+                        chunk.to_csv(output_path, mode='w' if total_rows == 0 else 'a',
+                                     header=total_rows == 0, index=False)
+                    
+                    total_rows += len(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+            
+            if preview is None:
+                # Empty result: still write the header/schema so the sink exists
+                preview = pd.read_sql_query(f"SELECT * FROM ({query.rstrip().rstrip(';')}) LIMIT 0", self.conn)
+                if parquet:
+                    pq.write_table(pa.Table.from_pandas(preview, schema=self.result_schema(query, preview),
+                                                        preserve_index=False), output_path)
+                else:
+                    preview.to_csv(output_path, index=False)
+        except Exception:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+        
+        return preview, total_rows
+    
+    def explain_query(self, query):
+        """Return the EXPLAIN QUERY PLAN detail lines for a query"""
+        plan = self.conn.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+        return [row[3] for row in plan]
+    
+    def _full_scans(self, query, plan):
+        """Return the plan lines that scan a base table without an index
+        
+        Handles both the 'SCAN <name>' format and the 'SCAN TABLE <name>'
+        format of SQLite < 3.36, and resolves table aliases used in the
+        query. Subquery, CTE, view and summary-table scans are not flagged.
+        """
+        base_tables = {
+            row[0].upper() for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        } - set(self.SUMMARY_TABLES)
+        
+        # alias -> table for every "FROM/JOIN <table> [AS] <alias>" in the query
+        aliases = {}
+        for table, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', query, re.IGNORECASE):
+            aliases[table.upper()] = table.upper()
+            if alias and alias.upper() not in self.SQL_KEYWORDS:
+                aliases[alias.upper()] = table.upper()
+        
+        full_scans = []
+        for detail in plan:
+            tokens = detail.split()
+            if tokens[0] != 'SCAN' or 'INDEX' in tokens:
+                continue
+            if len(tokens) > 2 and tokens[1] == 'TABLE':
+                tokens = tokens[:1] + tokens[2:]
+            name = tokens[1].upper() if len(tokens) > 1 else ''
+            if aliases.get(name, name) in base_tables:
+                full_scans.append(detail)
+        return full_scans
+    
+    def _profiled_query(self, query, label="", run=None):
+        """Run a query and record its profile
+        
+        By default the full result is read into a DataFrame. A custom run
+        callable must return a (result, row_count) tuple.
+        """
+        plan = self.explain_query(query)
+        
+        # Count VM steps in blocks of PROGRESS_STEP instructions
+        steps = [0]
+        def on_progress():
+            steps[0] += 1
+            return 0
+        
+        self.conn.set_progress_handler(on_progress, self.PROGRESS_STEP)
+        try:
+            start = time.perf_counter()
+            if run is None:
+                result = pd.read_sql_query(query, self.conn)
+                row_count = len(result)
+            else:
+                result = run(query)
+                row_count = result[1]
+            elapsed = time.perf_counter() - start
+        finally:
+            self.conn.set_progress_handler(None, 0)
+        
+        full_scans = self._full_scans(query, plan)
+        
+        self.query_profiles.append({
+            'label': label.strip(),
+            'query': " ".join(query.split()),
+            'wall_time_ms': round(elapsed * 1000, 3),
+            'rows_returned': row_count,
+            'vm_steps': steps[0] * self.PROGRESS_STEP,
+            'query_plan': plan,
+            'full_table_scan': bool(full_scans),
+            'full_scans': full_scans,
+        })
         
         return result
     
+    def save_query_profile(self, output_path='reports/sql_query_profile.json'):
+        """Save per-query profiling data as JSON"""
+        profile = {
+            'generated_on': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'database': ':memory:' if self.in_memory else self.db_name,
+            'vm_step_resolution': self.PROGRESS_STEP,
+            'total_wall_time_ms': round(sum(p['wall_time_ms'] for p in self.query_profiles), 3),
+            'full_scan_queries': [p['label'] for p in self.query_profiles if p['full_table_scan']],
+            'queries': self.query_profiles,
+        }
+        
+        with open(output_path, 'w') as f:
+            json.dump(profile, f, indent=2)
+        
+        print(f"\n✓ Query profile saved to {output_path}")
+        if profile['full_scan_queries']:
+            print(f"  {len(profile['full_scan_queries'])} queries perform full table scans:")
+            for label in profile['full_scan_queries']:
+                print(f"    - {label}")
+        
+        return profile
+    
+    def _store_result(self, key, result):
+        """Keep a query result and its full row count for the report"""
+        self.query_results[key] = result
+        self.query_row_counts[key] = self.query_profiles[-1]['rows_returned']
+    
     def run_all_queries(self):
         """Run all SQL analysis queries"""
         print("\n" + "="*70)
         print("SPACEX SQL ANALYSIS")
         print("="*70)
         
-        # Create database
-        self.create_database()
+        # Create database (or restore an in-memory snapshot)
+        self.load_database()
         
         queries = []
         
         # Query 1: Display all unique launch sites
         queries.append({
+            'key': 'launch_sites',
             'description': "Query 1: Display the names of the unique launch sites in the space mission",
             'query': "SELECT DISTINCT LaunchSite FROM SPACEXDATASET;"
         })
         
         # Query 2: Display 5 records where launch sites begin with 'CCA'
         queries.append({
+            'key': 'cca_records',
             'description': "Query 2: Display 5 records where launch sites begin with 'CCA'",
             'query': "SELECT * FROM SPACEXDATASET WHERE LaunchSite LIKE 'CCA%' LIMIT 5;"
         })
         
         # Query 3: Total payload mass carried by boosters launched by NASA (CRS)
         queries.append({
+            'key': 'crs_payload',
             'description': "Query 3: Display the total payload mass carried by boosters launched by NASA (CRS)",
-            'query': "SELECT SUM(PayloadMass) as TotalPayloadMass FROM SPACEXDATASET WHERE Name LIKE '%CRS%';"
+            'query': f"SELECT SUM(PayloadMass) as TotalPayloadMass FROM SPACEXDATASET WHERE {self.text_filter('Name', 'CRS')};"
         })
         
         # Query 4: Average payload mass carried by booster version F9 v1.1
         queries.append({
+            'key': 'f9_v11_payload',
             'description': "Query 4: Display average payload mass carried by booster version F9 v1.1",
-            'query': "SELECT AVG(PayloadMass) as AveragePayloadMass FROM SPACEXDATASET WHERE Rocket LIKE '%F9 v1.1%';"
+            'query': f"SELECT AVG(PayloadMass) as AveragePayloadMass FROM SPACEXDATASET WHERE {self.text_filter('Rocket', 'F9 v1.1')};"
         })
         
         # Query 5: Date of the first successful landing
         queries.append({
+            'key': 'first_successful_landing',
             'description': "Query 5: Display the date of the first successful landing outcome",
             'query': "SELECT MIN(Date) as FirstSuccessfulLanding FROM SPACEXDATASET WHERE LandingSuccess = 1;"
         })
         
         # Query 6: Successful drone ship landing with payload between 4000 and 6000
         queries.append({
+            'key': 'asds_boosters',
             'description': "Query 6: List names of boosters which have successful drone ship landing with payload mass between 4000 and 6000",
             'query': "SELECT Name FROM SPACEXDATASET WHERE LandingType = 'ASDS' AND PayloadMass BETWEEN 4000 AND 6000 AND LandingSuccess = 1;"
         })
         
         # Query 7: Total number of successful and failed mission outcomes
         queries.append({
+            'key': 'landing_outcomes',
             'description': "Query 7: Display the total number of successful and failure mission outcomes",
             'query': "SELECT LandingSuccess, COUNT(*) as Count FROM SPACEXDATASET WHERE LandingAttempt = 1 GROUP BY LandingSuccess;"
         })
         
         # Query 8: Booster names with maximum payload mass
         queries.append({
+            'key': 'max_payload_boosters',
             'description': "Query 8: List the names of the booster_versions which have carried the maximum payload mass",
             'query': "SELECT Name, PayloadMass FROM SPACEXDATASET WHERE PayloadMass = (SELECT MAX(PayloadMass) FROM SPACEXDATASET);"
         })
         
         # Query 9: Records of failed landing in 2015
         queries.append({
+            'key': 'failed_landings_2015',
             'description': "Query 9: List the records which show failed landings in 2015",
-            'query': "SELECT * FROM SPACEXDATASET WHERE SUBSTR(Date, 1, 4) = '2015' AND LandingSuccess = 0 AND LandingAttempt = 1;"
+            'query': "SELECT * FROM SPACEXDATASET WHERE SUBSTR(Date, 1, 4) = '2015' AND LandingSuccess = 0 AND LandingAttempt = 1;",
+            'output_path': 'reports/failed_landings_2015.csv'
         })
         
         # Query 10: Rank landing outcomes between 2010-06-04 and 2017-03-20
         queries.append({
+            'key': 'ranked_outcomes',
             'description': "Query 10: Rank landing outcomes between 2010-06-04 and 2017-03-20 in descending order",
             'query': "SELECT Date, LaunchSite, LandingSuccess FROM SPACEXDATASET WHERE Date BETWEEN '2010-06-04' AND '2017-03-20' ORDER BY Date DESC;"
         })
@@ -125,7 +787,9 @@ class SpaceXSQLAnalysis:
         # Execute all queries
         results = []
         for i, query_info in enumerate(queries, 1):
-            result = self.execute_query(query_info['query'], query_info['description'])
+            result = self.execute_query(query_info['query'], query_info['description'],
+                                        output_path=query_info.get('output_path'))
+            self._store_result(query_info['key'], result)
             results.append(result)
         
         # Additional analysis queries
@@ -139,16 +803,16 @@ class SpaceXSQLAnalysis:
         query = """
         SELECT 
             LaunchSite,
-            COUNT(*) as TotalLaunches,
-            SUM(CASE WHEN LandingSuccess = 1 THEN 1 ELSE 0 END) as SuccessfulLandings,
-            ROUND(AVG(CASE WHEN LandingSuccess = 1 THEN 100.0 ELSE 0.0 END), 2) as SuccessRate
-        FROM SPACEXDATASET
-        WHERE LandingAttempt = 1
-        GROUP BY LaunchSite
+            LandingAttempts as TotalLaunches,
+            SuccessfulLandings,
+            ROUND(100.0 * SuccessfulLandings / LandingAttempts, 2) as SuccessRate
+        FROM SUMMARY_SITE
+        WHERE LandingAttempts > 0
         ORDER BY SuccessRate DESC;
         """
-        result = pd.read_sql_query(query, self.conn)
-        print(result)
+        result = self._profiled_query(query, "Success Rate by Launch Site")
+        self._store_result('site_success', result)
+        self.print_preview(result)
         
         # Success rate by orbit type
         print("\n\nSuccess Rate by Orbit Type:")
@@ -156,34 +820,80 @@ class SpaceXSQLAnalysis:
         query = """
         SELECT 
             Orbit,
-            COUNT(*) as TotalLaunches,
-            SUM(CASE WHEN LandingSuccess = 1 THEN 1 ELSE 0 END) as SuccessfulLandings,
-            ROUND(AVG(CASE WHEN LandingSuccess = 1 THEN 100.0 ELSE 0.0 END), 2) as SuccessRate
-        FROM SPACEXDATASET
-        WHERE LandingAttempt = 1 AND Orbit != 'Unknown'
-        GROUP BY Orbit
-        HAVING COUNT(*) >= 3
+            LandingAttempts as TotalLaunches,
+            SuccessfulLandings,
+            ROUND(100.0 * SuccessfulLandings / LandingAttempts, 2) as SuccessRate
+        FROM SUMMARY_ORBIT
+        WHERE LandingAttempts >= 3 AND Orbit != 'Unknown'
         ORDER BY SuccessRate DESC;
         """
-        result = pd.read_sql_query(query, self.conn)
-        print(result)
+        result = self._profiled_query(query, "Success Rate by Orbit Type")
+        self._store_result('orbit_success', result)
+        self.print_preview(result)
         
         # Yearly trends
         print("\n\nYearly Launch Trends:")
         print("-" * 70)
         query = """
         SELECT 
-            SUBSTR(Date, 1, 4) as Year,
-            COUNT(*) as TotalLaunches,
-            SUM(CASE WHEN LandingSuccess = 1 THEN 1 ELSE 0 END) as SuccessfulLandings,
-            ROUND(AVG(CASE WHEN LandingSuccess = 1 THEN 100.0 ELSE 0.0 END), 2) as SuccessRate
-        FROM SPACEXDATASET
-        WHERE LandingAttempt = 1
-        GROUP BY Year
+            Year,
+            LandingAttempts as TotalLaunches,
+            SuccessfulLandings,
+            ROUND(100.0 * SuccessfulLandings / LandingAttempts, 2) as SuccessRate
+        FROM SUMMARY_YEAR
+        WHERE LandingAttempts > 0
         ORDER BY Year;
         """
-        result = pd.read_sql_query(query, self.conn)
-        print(result)
+        result = self._profiled_query(query, "Yearly Launch Trends")
+        self._store_result('yearly_trends', result)
+        self.print_preview(result)
+        
+        # Launch site locations
+        print("\n\nLaunch Site Locations:")
+        print("-" * 70)
+        query = """
+        SELECT 
+            s.LaunchSite,
+            p.FullName,
+            p.Latitude,
+            p.Longitude,
+            s.TotalLaunches
+        FROM SUMMARY_SITE s
+        LEFT JOIN LAUNCHPAD_KEYS k ON k.Key = s.LaunchSite
+        LEFT JOIN LAUNCHPADS p ON p.LaunchpadId = k.LaunchpadId
+        ORDER BY s.TotalLaunches DESC;
+        """
+        result = self._profiled_query(query, "Launch Site Locations")
+        self._store_result('site_locations', result)
+        self.print_preview(result)
+        
+        # Window-function analytics
+        print("\n" + "="*70)
+        print("WINDOW FUNCTION ANALYTICS")
+        print("="*70)
+        
+        result = self.execute_query(
+            "SELECT LaunchSite, Date as LastLaunch, SiteLaunches, CumulativeSuccessRate, RollingSuccessRate "
+            "FROM V_SITE_SUCCESS_TRENDS WHERE SiteLaunchNumber = SiteLaunches ORDER BY LaunchSite;",
+            f"Cumulative and rolling ({self.ROLLING_WINDOW}-launch) success rate by launch site"
+        )
+        self._store_result('site_trends', result)
+        
+        result = self.execute_query(
+            "SELECT Date, Name, LaunchSite, LaunchesSinceLastFailure FROM V_LAUNCH_STREAKS "
+            "ORDER BY LaunchesSinceLastFailure DESC, Date LIMIT 5;",
+            "Longest runs of launches without a failed landing"
+        )
+        self._store_result('failure_free_streaks', result)
+        
+        if self._has_column('Core'):
+            result = self.execute_query(
+                "SELECT Core, CoreTotalFlights, CoreLandingsToDate as SuccessfulLandings, Date as LastFlight "
+                "FROM V_CORE_REUSE WHERE CoreFlightNumber = CoreTotalFlights "
+                "ORDER BY CoreTotalFlights DESC, Core LIMIT 10;",
+                "Most reused booster cores"
+            )
+            self._store_result('core_reuse', result)
         
         print("\n" + "="*70)
         print("SQL ANALYSIS COMPLETE!")
@@ -191,54 +901,166 @@ class SpaceXSQLAnalysis:
         
         return results
     
-    def generate_sql_report(self):
-        """Generate comprehensive SQL analysis report"""
+    def _scalar(self, key):
+        """Return the single value of a one-cell query result, or None"""
+        result = self.query_results.get(key)
+        if result is None or result.empty or pd.isna(result.iloc[0, 0]):
+            return None
+        return result.iloc[0, 0]
+    
+    def _build_findings(self):
+        """Derive report findings from the stored query results"""
+        findings = {}
+        
+        sites = self.query_results.get('site_success')
+        if sites is not None and not sites.empty:
+            best = sites.iloc[0]
+            worst = sites.iloc[-1]
+            findings['launch_sites'] = [
+                f"{self.query_row_counts.get('launch_sites', len(sites))} launch sites used for Falcon 9 missions",
+                f"Highest landing success: {best['LaunchSite']} "
+                f"({best['SuccessRate']:.2f}% of {int(best['TotalLaunches'])} attempts)",
+                f"Lowest landing success: {worst['LaunchSite']} "
+                f"({worst['SuccessRate']:.2f}% of {int(worst['TotalLaunches'])} attempts)",
+            ]
+        
+        payload = []
+        crs_mass = self._scalar('crs_payload')
+        if crs_mass is not None:
+            payload.append(f"Total payload mass on CRS missions: {crs_mass:,.2f} kg")
+        f9_mass = self._scalar('f9_v11_payload')
+        if f9_mass is not None:
+            payload.append(f"Average payload mass on F9 v1.1: {f9_mass:,.2f} kg")
+        max_payload = self.query_results.get('max_payload_boosters')
+        if max_payload is not None and not max_payload.empty:
+            payload.append(
+                f"Maximum payload mass: {max_payload['PayloadMass'].iloc[0]:,.2f} kg "
+                f"({', '.join(max_payload['Name'].astype(str))})"
+            )
+        if payload:
+            findings['payload'] = payload
+        
+        landing = []
+        first_success = self._scalar('first_successful_landing')
+        if first_success is not None:
+            landing.append(f"First successful landing: {first_success}")
+        outcomes = self.query_results.get('landing_outcomes')
+        if outcomes is not None and not outcomes.empty:
+            counts = dict(zip(outcomes['LandingSuccess'], outcomes['Count']))
+            landing.append(
+                f"Landing attempts: {int(counts.get(1, 0))} successful, {int(counts.get(0, 0))} failed"
+            )
+        landing.append(
+            f"Failed landings in 2015: {self.query_row_counts.get('failed_landings_2015', 0)}"
+        )
+        years = self.query_results.get('yearly_trends')
+        if years is not None and not years.empty:
+            first, last = years.iloc[0], years.iloc[-1]
+            landing.append(
+                f"Success rate went from {first['SuccessRate']:.2f}% in {first['Year']} "
+                f"to {last['SuccessRate']:.2f}% in {last['Year']}"
+            )
+            best_year = years.loc[years['SuccessRate'].idxmax()]
+            landing.append(f"Best year: {best_year['Year']} ({best_year['SuccessRate']:.2f}%)")
+        findings['landing'] = landing
+        
+        orbits = self.query_results.get('orbit_success')
+        if orbits is not None and not orbits.empty:
+            best = orbits.iloc[0]
+            worst = orbits.iloc[-1]
+            findings['orbits'] = [
+                f"{len(orbits)} orbit types with at least 3 landing attempts",
+                f"Highest landing success: {best['Orbit']} ({best['SuccessRate']:.2f}%)",
+                f"Lowest landing success: {worst['Orbit']} ({worst['SuccessRate']:.2f}%)",
+            ]
+        
+        trends = []
+        site_trends = self.query_results.get('site_trends')
+        if site_trends is not None and not site_trends.empty:
+            for _, row in site_trends.iterrows():
+                trends.append(
+                    f"{row['LaunchSite']}: last {self.ROLLING_WINDOW} launches "
+                    f"{row['RollingSuccessRate']}% vs {row['CumulativeSuccessRate']}% overall"
+                )
+        streaks = self.query_results.get('failure_free_streaks')
+        if streaks is not None and not streaks.empty:
+            top = streaks.iloc[0]
+            trends.append(
+                f"Longest run without a failed landing: {int(top['LaunchesSinceLastFailure'])} "
+                f"launches (through {top['Date']})"
+            )
+        cores = self.query_results.get('core_reuse')
+        if cores is not None and not cores.empty:
+            top = cores.iloc[0]
+            trends.append(f"Most reused core: {top['Core']} ({int(top['CoreTotalFlights'])} flights)")
+        if trends:
+            findings['trends'] = trends
+        
+        return findings
+    
+    def generate_sql_report(self, output_path='reports/sql_analysis_report.txt',
+                            json_path='reports/sql_analysis_results.json'):
+        """Generate SQL analysis report from the results of run_all_queries"""
+        if not self.query_results:
+            self.run_all_queries()
+        
+        findings = self._build_findings()
+        generated_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
         report_lines = []
         report_lines.append("="*70)
         report_lines.append("SPACEX FALCON 9 - SQL ANALYSIS REPORT")
         report_lines.append("="*70)
         report_lines.append("")
-        report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report_lines.append(f"Generated on: {generated_on}")
         report_lines.append("")
         
         # Key findings from SQL queries
         report_lines.append("KEY FINDINGS FROM SQL ANALYSIS")
         report_lines.append("-" * 70)
         report_lines.append("")
-        report_lines.append("1. Launch Site Performance:")
-        report_lines.append("   - Multiple launch sites used for Falcon 9 missions")
-        report_lines.append("   - Success rates vary significantly by launch site")
-        report_lines.append("   - Some sites specialize in specific orbit types")
-        report_lines.append("")
         
-        report_lines.append("2. Payload Mass Trends:")
-        report_lines.append("   - Maximum payload mass increased over time")
-        report_lines.append("   - Payload mass correlates with orbit type")
-        report_lines.append("   - Heavier payloads generally go to lower orbits")
-        report_lines.append("")
-        
-        report_lines.append("3. Landing Success Evolution:")
-        report_lines.append("   - First successful landing marked a major milestone")
-        report_lines.append("   - Success rate improved significantly over the years")
-        report_lines.append("   - Recent missions show >80% landing success rate")
-        report_lines.append("")
-        
-        report_lines.append("4. Mission Outcomes by Orbit:")
-        report_lines.append("   - LEO (Low Earth Orbit) missions have highest success rate")
-        report_lines.append("   - GTO (Geostationary Transfer Orbit) missions more challenging")
-        report_lines.append("   - Orbit type is a significant predictor of landing success")
-        report_lines.append("")
+        sections = [
+            ('launch_sites', "Launch Site Performance"),
+            ('payload', "Payload Mass"),
+            ('landing', "Landing Success Evolution"),
+            ('orbits', "Mission Outcomes by Orbit"),
+            ('trends', "Time-Series Trends"),
+        ]
+        number = 1
+        for key, title in sections:
+            if key not in findings:
+                continue
+            report_lines.append(f"{number}. {title}:")
+            for line in findings[key]:
+                report_lines.append(f"   - {line}")
+            report_lines.append("")
+            number += 1
         
         report_lines.append("="*70)
         
         report_text = "\n".join(report_lines)
         
         # Save report
-        with open('reports/sql_analysis_report.txt', 'w') as f:
+        with open(output_path, 'w') as f:
             f.write(report_text)
         
+        # Save structured results
+        results = {
+            'generated_on': generated_on,
+            'findings': findings,
+            'row_counts': self.query_row_counts,
+            'results': {
+                key: json.loads(df.to_json(orient='records'))
+                for key, df in self.query_results.items()
+            },
+        }
+        with open(json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        
         print("\n" + report_text)
-        print("\n✓ Report saved to reports/sql_analysis_report.txt")
+        print(f"\n✓ Report saved to {output_path}")
+        print(f"✓ Results saved to {json_path}")
         
         return report_text
     
@@ -248,17 +1070,23 @@ class SpaceXSQLAnalysis:
             self.conn.close()
             print("\n✓ Database connection closed")
 
-def main():
-    """Main function to run SQL analysis"""
-    import os
+def main(snapshot=False):
+    """Main function to run SQL analysis
+    
+    The analysis runs against an in-memory database; pass snapshot=True
+    (or --snapshot on the command line) to also persist data/spacex.db.
+    """
     os.makedirs('data', exist_ok=True)
     os.makedirs('reports', exist_ok=True)
     
-    sql_analysis = SpaceXSQLAnalysis()
+    sql_analysis = SpaceXSQLAnalysis(in_memory=True)
     sql_analysis.run_all_queries()
     sql_analysis.generate_sql_report()
+    sql_analysis.save_query_profile()
+    if snapshot:
+        sql_analysis.save_snapshot()
     sql_analysis.close()
 
 if __name__ == "__main__":
-    main()
+    main(snapshot='--snapshot' in sys.argv)
 
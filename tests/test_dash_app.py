@@ -0,0 +1,77 @@
+"""Live dashboard cube filtering checked against a direct filter of the launch rows"""
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from spacex_dash_app import SpaceXDashboard
+
+SAMPLE_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'data', 'spacex_launch_data.csv')
+
+def synthetic_launches(n=2000, seed=0):
+    """Launch rows with missing payloads and sites, like sparse API data"""
+    rng = np.random.default_rng(seed)
+    payload = rng.uniform(0, 16000, n)
+    payload[rng.random(n) < 0.1] = np.nan
+    payload[:20:4] = [0.0, 500.0, 5000.0, 15500.0, 1000.0]  # exactly on bin edges
+    sites = rng.choice(['CCAFS SLC-40', 'KSC LC-39A', 'VAFB SLC-4E', None], n, p=[0.4, 0.3, 0.25, 0.05])
+    return pd.DataFrame({
+        'LaunchSite': sites,
+        'PayloadMass': payload,
+        'Year': rng.integers(2010, 2021, n),
+        'Orbit': rng.choice(['LEO', 'GTO', 'ISS', None], n),
+        'Class': rng.integers(0, 2, n),
+    })
+
+def filter_rows(dashboard, sites, payload_range):
+    """Filter the launch rows directly: sites, and payload in [low, high)"""
+    df = dashboard.df
+    mask = pd.Series(True, index=df.index)
+    if sites:
+        mask &= df['LaunchSite'].fillna('Unknown').isin(sites)
+    
+    low, high = payload_range
+    payload = df['PayloadMass']
+    known = payload > 0
+    in_range = known & (payload >= low) & (payload < high)
+    first_bin, last_bin = dashboard._payload_bin_limits()
+    if low <= first_bin * dashboard.PAYLOAD_BIN_KG and high >= (last_bin + 1) * dashboard.PAYLOAD_BIN_KG:
+        in_range |= ~known  # Full range keeps unknown payloads
+    return df[mask & in_range]
+
+def filter_states(dashboard):
+    """Every single bin, wider ranges and the full range, for all sites and each site"""
+    first_bin, last_bin = dashboard._payload_bin_limits()
+    edges = [b * dashboard.PAYLOAD_BIN_KG for b in range(first_bin, last_bin + 2)]
+    middle = edges[len(edges) // 2]
+    ranges = list(zip(edges, edges[1:])) + [(edges[0], middle), (middle, edges[-1]), (edges[0], edges[-1])]
+    site_sets = [[]] + [[site] for site in sorted(dashboard.cube['LaunchSite'].unique())]
+    return [(sites, payload_range) for sites in site_sets for payload_range in ranges]
+
+@pytest.fixture(params=['synthetic', 'sample'])
+def dashboard(request):
+    dashboard = SpaceXDashboard()
+    if request.param == 'sample':
+        if not os.path.exists(SAMPLE_DATA):
+            pytest.skip("sample data not generated")
+        dashboard.data_path = SAMPLE_DATA
+        dashboard.load_data()
+    else:
+        dashboard.df = synthetic_launches()
+    dashboard.compute_cube()
+    return dashboard
+
+def test_cube_filter_matches_row_filter(dashboard):
+    for sites, payload_range in filter_states(dashboard):
+        cube = dashboard._filter_cube(sites, payload_range)
+        rows = filter_rows(dashboard, sites, payload_range)
+        assert (int(cube['count'].sum()), int(cube['sum'].sum())) == (len(rows), int(rows['Class'].sum())), \
+            (sites, payload_range)
+
+def test_payload_upper_bound_is_exclusive(dashboard):
+    bin_kg = dashboard.PAYLOAD_BIN_KG
+    first_bin, last_bin = dashboard._payload_bin_limits()
+    low = (first_bin + 1) * bin_kg
+    one_bin = dashboard._filter_cube([], (low, low + bin_kg))
+    assert set(one_bin['PayloadBin']) <= {first_bin + 1}